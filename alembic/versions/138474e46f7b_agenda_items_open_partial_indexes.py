@@ -0,0 +1,36 @@
+"""Agenda items open partial indexes
+
+Revision ID: 138474e46f7b
+Revises: e3f6ecc80b02
+Create Date: 2026-10-15 10:04:52.771930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '138474e46f7b'
+down_revision: Union[str, None] = 'e3f6ecc80b02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_agenda_items_open_due',
+        'agenda_items',
+        ['workspace_id', 'due_date'],
+        unique=False,
+        postgresql_where=sa.text("status IN ('OPEN', 'IN_PROGRESS')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_agenda_items_open_due',
+        table_name='agenda_items',
+        postgresql_where=sa.text("status IN ('OPEN', 'IN_PROGRESS')"),
+    )
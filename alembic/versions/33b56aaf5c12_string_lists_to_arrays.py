@@ -0,0 +1,89 @@
+"""String lists to arrays
+
+Revision ID: 33b56aaf5c12
+Revises: 138474e46f7b
+Create Date: 2026-10-15 11:26:07.305114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '33b56aaf5c12'
+down_revision: Union[str, None] = '138474e46f7b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'agenda_items',
+        'tags',
+        existing_type=sa.String(length=500),
+        type_=postgresql.ARRAY(sa.String()),
+        existing_nullable=True,
+        postgresql_using="string_to_array(NULLIF(tags, ''), ',')",
+    )
+    op.alter_column(
+        'agenda_items',
+        'labels',
+        existing_type=sa.String(length=500),
+        type_=postgresql.ARRAY(sa.String()),
+        existing_nullable=True,
+        postgresql_using="string_to_array(NULLIF(labels, ''), ',')",
+    )
+    op.alter_column(
+        'decisions',
+        'involved_user_ids',
+        existing_type=sa.String(length=500),
+        type_=postgresql.ARRAY(sa.String()),
+        existing_nullable=True,
+        postgresql_using="string_to_array(NULLIF(involved_user_ids, ''), ',')",
+    )
+    op.create_index(
+        'ix_agenda_items_tags_gin',
+        'agenda_items',
+        ['tags'],
+        unique=False,
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_agenda_items_labels_gin',
+        'agenda_items',
+        ['labels'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_agenda_items_labels_gin', table_name='agenda_items', postgresql_using='gin')
+    op.drop_index('ix_agenda_items_tags_gin', table_name='agenda_items', postgresql_using='gin')
+    op.alter_column(
+        'decisions',
+        'involved_user_ids',
+        existing_type=postgresql.ARRAY(sa.String()),
+        type_=sa.String(length=500),
+        existing_nullable=True,
+        postgresql_using="array_to_string(involved_user_ids, ',')",
+    )
+    op.alter_column(
+        'agenda_items',
+        'labels',
+        existing_type=postgresql.ARRAY(sa.String()),
+        type_=sa.String(length=500),
+        existing_nullable=True,
+        postgresql_using="array_to_string(labels, ',')",
+    )
+    op.alter_column(
+        'agenda_items',
+        'tags',
+        existing_type=postgresql.ARRAY(sa.String()),
+        type_=sa.String(length=500),
+        existing_nullable=True,
+        postgresql_using="array_to_string(tags, ',')",
+    )
@@ -0,0 +1,113 @@
+"""Smallint enum codes
+
+Revision ID: 3ac111e4b143
+Revises: e2e2fa03fd79
+Create Date: 2026-10-15 14:03:48.529316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3ac111e4b143'
+down_revision: Union[str, None] = 'e2e2fa03fd79'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Codes are the member positions in ItemType / ItemStatus
+ITEM_TYPES = ('TASK', 'DECISION', 'OBLIGATION', 'QUESTION', 'ACTION_ITEM', 'NOTE', 'ANNOUNCEMENT')
+ITEM_STATUSES = ('OPEN', 'IN_PROGRESS', 'COMPLETED', 'DEFERRED', 'CANCELLED', 'STALE', 'DONE')
+
+
+def _to_code(column: str, names: tuple[str, ...]) -> str:
+    whens = " ".join(f"WHEN '{name}' THEN {code}" for code, name in enumerate(names))
+    return f"CASE {column}::text {whens} END"
+
+
+def _to_name(column: str, names: tuple[str, ...], enum_name: str) -> str:
+    whens = " ".join(f"WHEN {code} THEN '{name}'" for code, name in enumerate(names))
+    return f"(CASE {column} {whens} END)::{enum_name}"
+
+
+def upgrade() -> None:
+    # The partial-index predicates compare status to enum labels
+    op.drop_index(
+        'ix_agenda_items_open_due',
+        table_name='agenda_items',
+        postgresql_where=sa.text("status IN ('OPEN', 'IN_PROGRESS')"),
+    )
+    op.alter_column(
+        'agenda_items',
+        'type',
+        existing_type=sa.Enum(*ITEM_TYPES, name='itemtype'),
+        type_=sa.SmallInteger(),
+        existing_nullable=False,
+        postgresql_using=_to_code('type', ITEM_TYPES),
+    )
+    op.alter_column(
+        'agenda_items',
+        'status',
+        existing_type=sa.Enum(*ITEM_STATUSES, name='itemstatus'),
+        type_=sa.SmallInteger(),
+        existing_nullable=False,
+        postgresql_using=_to_code('status', ITEM_STATUSES),
+    )
+    op.alter_column(
+        'agenda_items',
+        'priority',
+        existing_type=sa.Integer(),
+        type_=sa.SmallInteger(),
+        existing_nullable=False,
+    )
+    op.execute("DROP TYPE IF EXISTS itemtype")
+    op.execute("DROP TYPE IF EXISTS itemstatus")
+    op.create_index(
+        'ix_agenda_items_open_due',
+        'agenda_items',
+        ['workspace_id', 'due_date'],
+        unique=False,
+        postgresql_where=sa.text("status IN (0, 1)"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_agenda_items_open_due',
+        table_name='agenda_items',
+        postgresql_where=sa.text("status IN (0, 1)"),
+    )
+    sa.Enum(*ITEM_TYPES, name='itemtype').create(op.get_bind())
+    sa.Enum(*ITEM_STATUSES, name='itemstatus').create(op.get_bind())
+    op.alter_column(
+        'agenda_items',
+        'priority',
+        existing_type=sa.SmallInteger(),
+        type_=sa.Integer(),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        'agenda_items',
+        'status',
+        existing_type=sa.SmallInteger(),
+        type_=sa.Enum(*ITEM_STATUSES, name='itemstatus'),
+        existing_nullable=False,
+        postgresql_using=_to_name('status', ITEM_STATUSES, 'itemstatus'),
+    )
+    op.alter_column(
+        'agenda_items',
+        'type',
+        existing_type=sa.SmallInteger(),
+        type_=sa.Enum(*ITEM_TYPES, name='itemtype'),
+        existing_nullable=False,
+        postgresql_using=_to_name('type', ITEM_TYPES, 'itemtype'),
+    )
+    op.create_index(
+        'ix_agenda_items_open_due',
+        'agenda_items',
+        ['workspace_id', 'due_date'],
+        unique=False,
+        postgresql_where=sa.text("status IN ('OPEN', 'IN_PROGRESS')"),
+    )
@@ -0,0 +1,68 @@
+"""Digest query indexes
+
+Revision ID: 4fd1c7aa537d
+Revises: 3ac111e4b143
+Create Date: 2026-10-15 15:22:10.884513
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4fd1c7aa537d'
+down_revision: Union[str, None] = '3ac111e4b143'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_agenda_items_user_type_status_due',
+            'agenda_items',
+            ['assigned_to_user_id', 'type', 'status', 'due_date'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_agenda_items_user_type_status_completed',
+            'agenda_items',
+            ['assigned_to_user_id', 'type', 'status', 'completed_at'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_agenda_items_channel_created',
+            'agenda_items',
+            ['source_channel_id', 'created_at'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_agenda_items_channel_created',
+            table_name='agenda_items',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_agenda_items_user_type_status_completed',
+            table_name='agenda_items',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_agenda_items_user_type_status_due',
+            table_name='agenda_items',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,49 @@
+"""FAQ answer tags to array
+
+Revision ID: 5b2e8f1d9a64
+Revises: 9e4f5c3577cb
+Create Date: 2026-10-15 23:01:42.516307
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2e8f1d9a64'
+down_revision: Union[str, None] = '9e4f5c3577cb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'faq_answers',
+        'tags',
+        existing_type=sa.String(length=500),
+        type_=postgresql.ARRAY(sa.String()),
+        existing_nullable=True,
+        postgresql_using="string_to_array(NULLIF(tags, ''), ',')",
+    )
+    op.create_index(
+        'ix_faq_answers_tags_gin',
+        'faq_answers',
+        ['tags'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_faq_answers_tags_gin', table_name='faq_answers', postgresql_using='gin')
+    op.alter_column(
+        'faq_answers',
+        'tags',
+        existing_type=postgresql.ARRAY(sa.String()),
+        type_=sa.String(length=500),
+        existing_nullable=True,
+        postgresql_using="array_to_string(tags, ',')",
+    )
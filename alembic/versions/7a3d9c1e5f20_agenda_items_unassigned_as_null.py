@@ -0,0 +1,52 @@
+"""Agenda items unassigned as null
+
+Revision ID: 7a3d9c1e5f20
+Revises: d41a7c2e8b90
+Create Date: 2026-10-15 23:12:41.508317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a3d9c1e5f20'
+down_revision: Union[str, None] = 'd41a7c2e8b90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("UPDATE agenda_items SET assigned_to_user_id = NULL WHERE assigned_to_user_id = ''")
+    op.create_check_constraint(
+        'ck_agenda_items_assignee_nonempty',
+        'agenda_items',
+        "assigned_to_user_id IS NULL OR assigned_to_user_id <> ''",
+    )
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    # (codes: type TASK=0, status OPEN=0, IN_PROGRESS=1)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_agenda_items_unassigned_open',
+            'agenda_items',
+            ['workspace_id'],
+            unique=False,
+            postgresql_where=sa.text(
+                'assigned_to_user_id IS NULL AND type = 0 AND status IN (0, 1)'
+            ),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_agenda_items_unassigned_open',
+            table_name='agenda_items',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_constraint('ck_agenda_items_assignee_nonempty', 'agenda_items', type_='check')
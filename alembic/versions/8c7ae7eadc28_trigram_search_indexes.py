@@ -0,0 +1,49 @@
+"""Trigram search indexes
+
+Revision ID: 8c7ae7eadc28
+Revises: c8083c23d281
+Create Date: 2026-10-15 22:51:12.783485
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c7ae7eadc28'
+down_revision: Union[str, None] = 'c8083c23d281'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TRIGRAM_INDEXES = [
+    ('ix_agenda_items_title_trgm', 'agenda_items', 'title'),
+    ('ix_agenda_items_description_trgm', 'agenda_items', 'description'),
+    ('ix_agenda_items_project_trgm', 'agenda_items', 'project'),
+    ('ix_faq_answers_question_trgm', 'faq_answers', 'question'),
+    ('ix_faq_answers_answer_trgm', 'faq_answers', 'answer'),
+]
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, column in TRIGRAM_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(TRIGRAM_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
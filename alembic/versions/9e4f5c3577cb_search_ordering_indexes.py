@@ -0,0 +1,68 @@
+"""Search ordering indexes
+
+Revision ID: 9e4f5c3577cb
+Revises: 8c7ae7eadc28
+Create Date: 2026-10-15 22:52:54.358413
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4f5c3577cb'
+down_revision: Union[str, None] = '8c7ae7eadc28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_agenda_items_ws_type_updated',
+            'agenda_items',
+            ['workspace_id', 'type', 'updated_at'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_agenda_items_ws_type_created',
+            'agenda_items',
+            ['workspace_id', 'type', 'created_at'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_agenda_items_assignee_updated',
+            'agenda_items',
+            ['assigned_to_user_id', 'updated_at'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_agenda_items_assignee_updated',
+            table_name='agenda_items',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_agenda_items_ws_type_created',
+            table_name='agenda_items',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_agenda_items_ws_type_updated',
+            table_name='agenda_items',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,33 @@
+"""Agenda items due_at generated
+
+Revision ID: b6e1f4a8c352
+Revises: 7a3d9c1e5f20
+Create Date: 2026-10-15 23:15:07.731946
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e1f4a8c352'
+down_revision: Union[str, None] = '7a3d9c1e5f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # due_at mirrors due_date; let the database derive it
+    op.drop_column('agenda_items', 'due_at')
+    op.add_column(
+        'agenda_items',
+        sa.Column('due_at', sa.DateTime(), sa.Computed('due_date', persisted=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('agenda_items', 'due_at')
+    op.add_column('agenda_items', sa.Column('due_at', sa.DateTime(), nullable=True))
+    op.execute('UPDATE agenda_items SET due_at = due_date')
@@ -0,0 +1,55 @@
+"""JSON text columns to jsonb
+
+Revision ID: c8083c23d281
+Revises: 4fd1c7aa537d
+Create Date: 2026-10-15 22:49:37.428382
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8083c23d281'
+down_revision: Union[str, None] = '4fd1c7aa537d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+JSON_COLUMNS = [
+    ('user_profiles', 'notification_preferences', True),
+    ('user_profiles', 'focus_mode_settings', True),
+    ('workspace_configs', 'watched_channels', True),
+    ('workspace_configs', 'important_channels', True),
+    ('workspace_configs', 'ignored_channels', True),
+    ('workspace_configs', 'config', True),
+    ('views', 'filters', False),
+]
+
+
+def upgrade() -> None:
+    for table, column, nullable in JSON_COLUMNS:
+        using = f"NULLIF({column}, '')::jsonb" if nullable else f"{column}::jsonb"
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.Text(),
+            type_=postgresql.JSONB(),
+            existing_nullable=nullable,
+            postgresql_using=using,
+        )
+
+
+def downgrade() -> None:
+    for table, column, nullable in reversed(JSON_COLUMNS):
+        op.alter_column(
+            table,
+            column,
+            existing_type=postgresql.JSONB(),
+            type_=sa.Text(),
+            existing_nullable=nullable,
+            postgresql_using=f"{column}::text",
+        )
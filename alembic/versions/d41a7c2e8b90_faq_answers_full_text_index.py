@@ -0,0 +1,47 @@
+"""FAQ answers full-text index
+
+Revision ID: d41a7c2e8b90
+Revises: 5b2e8f1d9a64
+Create Date: 2026-10-15 23:05:18.204936
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41a7c2e8b90'
+down_revision: Union[str, None] = '5b2e8f1d9a64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_faq_answers_search_tsv',
+            'faq_answers',
+            [
+                sa.text(
+                    "to_tsvector('english', "
+                    "coalesce(question, '') || ' ' || coalesce(answer, ''))"
+                )
+            ],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_faq_answers_search_tsv',
+            table_name='faq_answers',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,212 @@
+"""Native uuid ids
+
+Revision ID: e2e2fa03fd79
+Revises: 33b56aaf5c12
+Create Date: 2026-10-15 12:41:19.062655
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2e2fa03fd79'
+down_revision: Union[str, None] = '33b56aaf5c12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_constraint(
+        'agenda_item_history_item_id_fkey',
+        'agenda_item_history',
+        type_='foreignkey',
+    )
+    op.drop_constraint('decisions_agenda_item_id_fkey', 'decisions', type_='foreignkey')
+    op.alter_column(
+        'agenda_items',
+        'id',
+        existing_type=sa.String(length=36),
+        type_=sa.Uuid(),
+        existing_nullable=False,
+        postgresql_using='id::uuid',
+    )
+    op.alter_column(
+        'user_profiles',
+        'id',
+        existing_type=sa.String(length=36),
+        type_=sa.Uuid(),
+        existing_nullable=False,
+        postgresql_using='id::uuid',
+    )
+    op.alter_column(
+        'workspace_configs',
+        'id',
+        existing_type=sa.String(length=36),
+        type_=sa.Uuid(),
+        existing_nullable=False,
+        postgresql_using='id::uuid',
+    )
+    op.alter_column(
+        'views',
+        'id',
+        existing_type=sa.String(length=36),
+        type_=sa.Uuid(),
+        existing_nullable=False,
+        postgresql_using='id::uuid',
+    )
+    op.alter_column(
+        'thread_titles',
+        'id',
+        existing_type=sa.String(length=36),
+        type_=sa.Uuid(),
+        existing_nullable=False,
+        postgresql_using='id::uuid',
+    )
+    op.alter_column(
+        'decisions',
+        'id',
+        existing_type=sa.String(length=36),
+        type_=sa.Uuid(),
+        existing_nullable=False,
+        postgresql_using='id::uuid',
+    )
+    op.alter_column(
+        'faq_answers',
+        'id',
+        existing_type=sa.String(length=36),
+        type_=sa.Uuid(),
+        existing_nullable=False,
+        postgresql_using='id::uuid',
+    )
+    op.alter_column(
+        'agenda_item_history',
+        'item_id',
+        existing_type=sa.String(length=36),
+        type_=sa.Uuid(),
+        existing_nullable=False,
+        postgresql_using='item_id::uuid',
+    )
+    op.alter_column(
+        'decisions',
+        'agenda_item_id',
+        existing_type=sa.String(length=36),
+        type_=sa.Uuid(),
+        existing_nullable=True,
+        postgresql_using='agenda_item_id::uuid',
+    )
+    op.create_foreign_key(
+        'agenda_item_history_item_id_fkey',
+        'agenda_item_history',
+        'agenda_items',
+        ['item_id'],
+        ['id'],
+        ondelete='CASCADE',
+    )
+    op.create_foreign_key(
+        'decisions_agenda_item_id_fkey',
+        'decisions',
+        'agenda_items',
+        ['agenda_item_id'],
+        ['id'],
+        ondelete='SET NULL',
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        'agenda_item_history_item_id_fkey',
+        'agenda_item_history',
+        type_='foreignkey',
+    )
+    op.drop_constraint('decisions_agenda_item_id_fkey', 'decisions', type_='foreignkey')
+    op.alter_column(
+        'decisions',
+        'agenda_item_id',
+        existing_type=sa.Uuid(),
+        type_=sa.String(length=36),
+        existing_nullable=True,
+        postgresql_using='agenda_item_id::text',
+    )
+    op.alter_column(
+        'agenda_item_history',
+        'item_id',
+        existing_type=sa.Uuid(),
+        type_=sa.String(length=36),
+        existing_nullable=False,
+        postgresql_using='item_id::text',
+    )
+    op.alter_column(
+        'faq_answers',
+        'id',
+        existing_type=sa.Uuid(),
+        type_=sa.String(length=36),
+        existing_nullable=False,
+        postgresql_using='id::text',
+    )
+    op.alter_column(
+        'decisions',
+        'id',
+        existing_type=sa.Uuid(),
+        type_=sa.String(length=36),
+        existing_nullable=False,
+        postgresql_using='id::text',
+    )
+    op.alter_column(
+        'thread_titles',
+        'id',
+        existing_type=sa.Uuid(),
+        type_=sa.String(length=36),
+        existing_nullable=False,
+        postgresql_using='id::text',
+    )
+    op.alter_column(
+        'views',
+        'id',
+        existing_type=sa.Uuid(),
+        type_=sa.String(length=36),
+        existing_nullable=False,
+        postgresql_using='id::text',
+    )
+    op.alter_column(
+        'workspace_configs',
+        'id',
+        existing_type=sa.Uuid(),
+        type_=sa.String(length=36),
+        existing_nullable=False,
+        postgresql_using='id::text',
+    )
+    op.alter_column(
+        'user_profiles',
+        'id',
+        existing_type=sa.Uuid(),
+        type_=sa.String(length=36),
+        existing_nullable=False,
+        postgresql_using='id::text',
+    )
+    op.alter_column(
+        'agenda_items',
+        'id',
+        existing_type=sa.Uuid(),
+        type_=sa.String(length=36),
+        existing_nullable=False,
+        postgresql_using='id::text',
+    )
+    op.create_foreign_key(
+        'agenda_item_history_item_id_fkey',
+        'agenda_item_history',
+        'agenda_items',
+        ['item_id'],
+        ['id'],
+        ondelete='CASCADE',
+    )
+    op.create_foreign_key(
+        'decisions_agenda_item_id_fkey',
+        'decisions',
+        'agenda_items',
+        ['agenda_item_id'],
+        ['id'],
+        ondelete='SET NULL',
+    )
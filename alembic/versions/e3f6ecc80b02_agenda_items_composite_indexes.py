@@ -0,0 +1,58 @@
+"""Agenda items composite indexes
+
+Revision ID: e3f6ecc80b02
+Revises: 3c8d6a98644d
+Create Date: 2026-10-15 09:12:31.418207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3f6ecc80b02'
+down_revision: Union[str, None] = '3c8d6a98644d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_agenda_items_ws_assignee',
+        'agenda_items',
+        ['workspace_id', 'assigned_to_user_id'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_agenda_items_ws_requestor',
+        'agenda_items',
+        ['workspace_id', 'requestor_user_id'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_agenda_items_ws_project',
+        'agenda_items',
+        ['workspace_id', 'project'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_agenda_items_ws_thread',
+        'agenda_items',
+        ['workspace_id', 'source_thread_ts'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_agenda_items_ws_status_due',
+        'agenda_items',
+        ['workspace_id', 'status', 'due_date'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_agenda_items_ws_status_due', table_name='agenda_items')
+    op.drop_index('ix_agenda_items_ws_thread', table_name='agenda_items')
+    op.drop_index('ix_agenda_items_ws_project', table_name='agenda_items')
+    op.drop_index('ix_agenda_items_ws_requestor', table_name='agenda_items')
+    op.drop_index('ix_agenda_items_ws_assignee', table_name='agenda_items')
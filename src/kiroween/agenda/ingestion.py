@@ -1,7 +1,12 @@
 """Message ingestion service: Analyze Slack messages and create/update agenda items."""
 
+import asyncio
 import re
-from datetime import datetime, timedelta
+from collections.abc import AsyncIterator, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, time, timedelta
+from functools import lru_cache
+from itertools import islice
 from typing import Any
 
 from kiroween.agenda.models import AgendaItem, ItemStatus, ItemType
@@ -10,6 +15,121 @@ from kiroween.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Threads/backfills with at least this many items are written with COPY
+COPY_THRESHOLD = 100
+
+# Message scrubbing / extraction patterns
+_MENTION_TAG_RE = re.compile(r"<@\w+>")
+_URL_ANGLE_RE = re.compile(r"<https?://[^>]+>")
+_URL_RE = re.compile(r"https?://\S+")
+_MARKDOWN_RE = re.compile(r"[*_`]")
+_SENTENCE_END_RE = re.compile(r"[.!?]")
+_AT_MENTION_RE = re.compile(r"@(\w+)")
+_PROJECT_RE = re.compile(r"project[:\s]+(\w+)", re.IGNORECASE)
+# Anything the title scrub would change: tags, markdown, URLs, newlines, sentence ends
+_NEEDS_SCRUB_RE = re.compile(r"[<*_`\n.!?]|https?://")
+
+# Explicit item-type markers, in priority order
+_ITEM_MARKERS: tuple[tuple[ItemType, tuple[str, ...]], ...] = (
+    (ItemType.TASK, ("todo:", "action item:", "task:")),
+    (ItemType.DECISION, ("decision:", "we decided", "agreed to", "consensus:")),
+    (ItemType.QUESTION, ("question:", "?", "can someone", "does anyone")),
+    (ItemType.ANNOUNCEMENT, ("announcement:", "announcing", "update:")),
+)
+_ITEM_MARKER_RANK = {
+    marker: rank
+    for rank, (_, markers) in enumerate(_ITEM_MARKERS)
+    for marker in markers
+}
+# Due date phrases, in priority order; phrases with no resolvable date
+# ("before standup", "by 12/5", "next week") are not matched
+_DUE_DATE_PHRASES: tuple[tuple[str, str], ...] = (
+    ("day_of_week", r"by\s+(?P<weekday>friday|monday|tuesday|wednesday|thursday|saturday|sunday)"),
+    ("today", r"by\s+(?:eod|end of day)"),
+    ("end_of_week", r"by\s+(?:eow|end of week)"),
+    ("relative_days", r"(?P<amount>\d+)\s+(?P<unit>days?|hours?)\s+from now"),
+    ("tomorrow", r"tomorrow"),
+)
+_DUE_DATE_RANK = {name: rank for rank, (name, _) in enumerate(_DUE_DATE_PHRASES)}
+_DUE_DATE_RE = re.compile(
+    "(?=" + "|".join(f"(?P<{name}>{pattern})" for name, pattern in _DUE_DATE_PHRASES) + ")",
+    re.IGNORECASE,
+)
+_EOD = time(17, 0)  # Default due time for date-only phrases
+_WEEKDAYS = {
+    "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
+    "friday": 4, "saturday": 5, "sunday": 6
+}
+
+# Parse results are pure functions of the text; Slack redeliveries and
+# thread re-scans hit the same messages repeatedly
+_PARSE_CACHE_SIZE = 8192
+
+# Zero-width lookahead so overlapping markers (e.g. "agreed todo:") are all seen
+_ITEM_MARKER_RE = re.compile(
+    "(?=(" + "|".join(re.escape(marker) for marker in _ITEM_MARKER_RANK) + "))"
+)
+
+# Keywords that make an otherwise unclassified note worth keeping
+_NOTE_KEYWORDS = ("important", "note:", "reminder", "update")
+
+# Cheap pre-filter: a message matching none of these can only become a NOTE
+# without a note keyword, so it is skipped before any classification runs.
+# Covers the item markers, the note keywords and the TASK_PATTERNS prefixes.
+_RELEVANCE_RE = re.compile(
+    "|".join(
+        [re.escape(keyword) for keyword in (*_ITEM_MARKER_RANK, *_NOTE_KEYWORDS)]
+        + [r"can you\s", r"please\s", r"i need you to\s", r"i'll\s", r"let's\s", r"we should\s"]
+    ),
+    re.IGNORECASE,
+)
+
+
+@dataclass(slots=True, frozen=True)
+class _MessageTokens:
+    """Per-message text views computed once and shared by the extractors."""
+
+    text: str
+    lower: str
+    mentions: tuple[str, ...]
+
+
+def _tokenize(message_text: str) -> _MessageTokens:
+    """Lowercase the message and collect its @mentions in one place."""
+    return _MessageTokens(
+        text=message_text,
+        lower=message_text.lower(),
+        mentions=tuple(_AT_MENTION_RE.findall(message_text)),
+    )
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def extract_title(message_text: str, max_length: int = 100) -> str:
+    """Scrub message text down to a short title, or "" if nothing is left.
+
+    Callers supply their own fallback for an empty title.
+    """
+    # Short plain text is already its own title
+    if len(message_text) <= max_length and not _NEEDS_SCRUB_RE.search(message_text):
+        return message_text.strip()
+
+    # Remove markdown, mentions, URLs
+    text = _MENTION_TAG_RE.sub("", message_text)
+    text = _URL_ANGLE_RE.sub("", text)
+    text = _URL_RE.sub("", text)
+    text = _MARKDOWN_RE.sub("", text)
+
+    # Take first sentence or first line
+    lines = text.split("\n")
+    first_line = lines[0].strip()
+    sentences = _SENTENCE_END_RE.split(first_line)
+    title = sentences[0].strip() if sentences else first_line
+
+    if len(title) > max_length:
+        title = title[:max_length - 3] + "..."
+
+    return title
+
 
 class MessageIngestionService:
     """Service for ingesting Slack messages and creating agenda items."""
@@ -19,61 +139,57 @@ class MessageIngestionService:
 
     # Task detection patterns
     TASK_PATTERNS = [
-        r"can you\s+([^?.!]+)",
-        r"please\s+([^?.!]+)",
-        r"i need you to\s+([^?.!]+)",
-        r"todo:\s*([^\n]+)",
-        r"@(\w+)\s+can you\s+([^?.!]+)",
-        r"@(\w+)\s+please\s+([^?.!]+)",
-        r"i'll\s+([^?.!]+)",
-        r"let's\s+([^?.!]+)",
-        r"we should\s+([^?.!]+)",
-        r"action item:\s*([^\n]+)",
-    ]
-
-    # Due date patterns
-    DUE_DATE_PATTERNS = [
-        (r"by\s+(friday|monday|tuesday|wednesday|thursday|saturday|sunday)", "day_of_week"),
-        (r"by\s+(eod|end of day)", "today"),
-        (r"by\s+(eow|end of week)", "end_of_week"),
-        (r"before\s+(standup|meeting|demo)", "relative"),
-        (r"by\s+(\d{1,2}/\d{1,2}(?:/\d{2,4})?)", "date"),
-        (r"(\d+)\s+(days?|hours?)\s+from now", "relative_days"),
-        (r"tomorrow", "tomorrow"),
-        (r"next\s+(week|month)", "relative"),
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in (
+            r"can you\s+([^?.!]+)",
+            r"please\s+([^?.!]+)",
+            r"i need you to\s+([^?.!]+)",
+            r"todo:\s*([^\n]+)",
+            r"@(\w+)\s+can you\s+([^?.!]+)",
+            r"@(\w+)\s+please\s+([^?.!]+)",
+            r"i'll\s+([^?.!]+)",
+            r"let's\s+([^?.!]+)",
+            r"we should\s+([^?.!]+)",
+            r"action item:\s*([^\n]+)",
+        )
     ]
 
     # Completion patterns
     COMPLETION_PATTERNS = [
-        r"done",
-        r"finished",
-        r"completed",
-        r"✅",
-        r"✓",
-        r"resolved",
-        r"closed",
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in (
+            r"done",
+            r"finished",
+            r"completed",
+            r"✅",
+            r"✓",
+            r"resolved",
+            r"closed",
+        )
     ]
 
     def detect_item_type(self, message_text: str, thread_context: list[dict] | None = None) -> ItemType:
         """Detect the type of agenda item from message content."""
-        text_lower = message_text.lower()
-
-        # Check for explicit markers
-        if any(pattern in text_lower for pattern in ["todo:", "action item:", "task:"]):
-            return ItemType.TASK
-
-        if any(pattern in text_lower for pattern in ["decision:", "we decided", "agreed to", "consensus:"]):
-            return ItemType.DECISION
-
-        if any(pattern in text_lower for pattern in ["question:", "?", "can someone", "does anyone"]):
-            return ItemType.QUESTION
-
-        if any(pattern in text_lower for pattern in ["announcement:", "announcing", "update:"]):
-            return ItemType.ANNOUNCEMENT
+        return self._detect_item_type(message_text.lower())
+
+    @staticmethod
+    @lru_cache(maxsize=_PARSE_CACHE_SIZE)
+    def _detect_item_type(text_lower: str) -> ItemType:
+        """Detect the item type from already-lowercased message text."""
+        # Check for explicit markers (single pass, highest-priority category wins)
+        best_rank = None
+        for match in _ITEM_MARKER_RE.finditer(text_lower):
+            rank = _ITEM_MARKER_RANK[match.group(1)]
+            if best_rank is None or rank < best_rank:
+                best_rank = rank
+                if rank == 0:
+                    break
+        if best_rank is not None:
+            return _ITEM_MARKERS[best_rank][0]
 
         # Check for task patterns
-        for pattern in self.TASK_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
+        for pattern in MessageIngestionService.TASK_PATTERNS:
+            if pattern.search(text_lower):
                 return ItemType.TASK
 
         # Default to note if unclear
@@ -81,80 +197,87 @@ class MessageIngestionService:
 
     def extract_assignee(self, message_text: str, mentions: list[str] | None = None) -> tuple[str | None, str | None]:
         """Extract assignee from message (user_id, user_name)."""
+        return self._extract_assignee(_AT_MENTION_RE.findall(message_text), mentions)
+
+    def _extract_assignee(
+        self, text_mentions: Sequence[str], mentions: list[str] | None = None
+    ) -> tuple[str | None, str | None]:
+        """Pick the assignee from explicit mentions, else in-text @mentions."""
         if mentions:
             # First mention is likely the assignee
-            return mentions[0], None  # user_name would need to be looked up
+            return mentions[0] or None, None  # user_name would need to be looked up
 
         # Check for @mentions in text
-        mention_pattern = r"@(\w+)"
-        matches = re.findall(mention_pattern, message_text)
-        if matches:
-            return matches[0], None
+        if text_mentions:
+            return text_mentions[0], None
 
         return None, None
 
     def extract_due_date(self, message_text: str, message_ts: str | None = None) -> datetime | None:
         """Extract due date from message text."""
-        text_lower = message_text.lower()
-        base_time = datetime.utcnow()
+        return self._extract_due_date(message_text.lower(), message_ts)
+
+    def _extract_due_date(self, text_lower: str, message_ts: str | None = None) -> datetime | None:
+        """Extract due date from already-lowercased message text."""
+        match = self._match_due_phrase(text_lower)
+        if match is None:
+            return None
+
+        # Only resolve the reference time once a phrase has matched
+        base_time = None
         if message_ts:
             try:
                 base_time = datetime.fromtimestamp(float(message_ts))
             except (ValueError, TypeError):
                 pass
-
-        for pattern, pattern_type in self.DUE_DATE_PATTERNS:
-            match = re.search(pattern, text_lower, re.IGNORECASE)
-            if match:
-                if pattern_type == "today":
-                    return base_time.replace(hour=17, minute=0, second=0, microsecond=0)  # EOD
-                elif pattern_type == "tomorrow":
-                    return (base_time + timedelta(days=1)).replace(hour=17, minute=0, second=0, microsecond=0)
-                elif pattern_type == "end_of_week":
-                    days_until_friday = (4 - base_time.weekday()) % 7
-                    if days_until_friday == 0:
-                        days_until_friday = 7
-                    return (base_time + timedelta(days=days_until_friday)).replace(hour=17, minute=0, second=0, microsecond=0)
-                elif pattern_type == "day_of_week":
-                    day_name = match.group(1).lower()
-                    day_map = {
-                        "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
-                        "friday": 4, "saturday": 5, "sunday": 6
-                    }
-                    target_day = day_map.get(day_name)
-                    if target_day is not None:
-                        days_ahead = (target_day - base_time.weekday()) % 7
-                        if days_ahead == 0:
-                            days_ahead = 7
-                        return (base_time + timedelta(days=days_ahead)).replace(hour=17, minute=0, second=0, microsecond=0)
-                elif pattern_type == "relative_days":
-                    num = int(match.group(1))
-                    unit = match.group(2)
-                    if "day" in unit:
-                        return (base_time + timedelta(days=num)).replace(hour=17, minute=0, second=0, microsecond=0)
-                    elif "hour" in unit:
-                        return base_time + timedelta(hours=num)
+        if base_time is None:
+            base_time = datetime.now(UTC).replace(tzinfo=None)
+
+        pattern_type = match.lastgroup
+        base_date = base_time.date()
+        if pattern_type == "today":
+            return datetime.combine(base_date, _EOD)
+        elif pattern_type == "tomorrow":
+            return datetime.combine(base_date + timedelta(days=1), _EOD)
+        elif pattern_type == "end_of_week":
+            days_until_friday = (4 - base_time.weekday()) % 7
+            if days_until_friday == 0:
+                days_until_friday = 7
+            return datetime.combine(base_date + timedelta(days=days_until_friday), _EOD)
+        elif pattern_type == "day_of_week":
+            target_day = _WEEKDAYS[match.group("weekday")]
+            days_ahead = (target_day - base_time.weekday()) % 7
+            if days_ahead == 0:
+                days_ahead = 7
+            return datetime.combine(base_date + timedelta(days=days_ahead), _EOD)
+        elif pattern_type == "relative_days":
+            num = int(match.group("amount"))
+            if "day" in match.group("unit"):
+                return datetime.combine(base_date + timedelta(days=num), _EOD)
+            return base_time + timedelta(hours=num)
 
         return None
 
+    @staticmethod
+    @lru_cache(maxsize=_PARSE_CACHE_SIZE)
+    def _match_due_phrase(text_lower: str) -> re.Match[str] | None:
+        """Find the highest-priority due-date phrase in lowercased text."""
+        # Single pass; the highest-priority phrase wins regardless of position
+        match: re.Match[str] | None = None
+        best_rank = len(_DUE_DATE_RANK)
+        for candidate in _DUE_DATE_RE.finditer(text_lower):
+            # Every alternative is a named group, so one always matched
+            assert candidate.lastgroup is not None
+            rank = _DUE_DATE_RANK[candidate.lastgroup]
+            if rank < best_rank:
+                match, best_rank = candidate, rank
+                if rank == 0:
+                    break
+        return match
+
     def extract_title(self, message_text: str, max_length: int = 100) -> str:
         """Extract a short title from message text."""
-        # Remove markdown, mentions, URLs
-        text = re.sub(r"<@\w+>", "", message_text)
-        text = re.sub(r"<https?://[^>]+>", "", text)
-        text = re.sub(r"https?://\S+", "", text)
-        text = re.sub(r"[*_`]", "", text)
-
-        # Take first sentence or first line
-        lines = text.split("\n")
-        first_line = lines[0].strip()
-        sentences = re.split(r"[.!?]", first_line)
-        title = sentences[0].strip() if sentences else first_line
-
-        if len(title) > max_length:
-            title = title[:max_length - 3] + "..."
-
-        return title or "Untitled"
+        return extract_title(message_text, max_length) or "Untitled"
 
     def extract_project_topic(self, message_text: str, channel_name: str | None = None) -> tuple[str | None, str | None]:
         """Extract project and topic from message or channel."""
@@ -162,7 +285,7 @@ class MessageIngestionService:
         topic = None
 
         # Check for explicit project markers
-        project_match = re.search(r"project[:\s]+(\w+)", message_text, re.IGNORECASE)
+        project_match = _PROJECT_RE.search(message_text)
         if project_match:
             project = project_match.group(1)
 
@@ -173,42 +296,42 @@ class MessageIngestionService:
 
         return project, topic
 
-    async def ingest_message(
+    def _build_item_row(
         self,
         message: dict[str, Any],
         workspace_id: str | None = None,
         thread_context: list[dict] | None = None,
-    ) -> AgendaItem | None:
-        """Ingest a Slack message and create/update agenda items.
-
-        Args:
-            message: Slack message dict with text, user, ts, channel, etc.
-            workspace_id: Workspace ID
-            thread_context: List of messages in the thread for context
+    ) -> dict[str, Any] | None:
+        """Parse a Slack message into agenda item column values.
 
         Returns:
-            Created or updated AgendaItem, or None if not relevant
+            Column values for a new AgendaItem, or None if not relevant
         """
         message_text = message.get("text", "")
         if not message_text or len(message_text.strip()) < 10:
             return None  # Skip very short messages
 
+        # Skip obvious chatter before running the classifiers
+        tokens = _tokenize(message_text)
+        if not _RELEVANCE_RE.search(tokens.lower):
+            return None
+
         # Detect item type
-        item_type = self.detect_item_type(message_text, thread_context)
+        item_type = self._detect_item_type(tokens.lower)
 
         # Skip pure chatter (notes without clear purpose)
         if item_type == ItemType.NOTE and not any(
-            keyword in message_text.lower()
-            for keyword in ["important", "note:", "reminder", "update"]
+            keyword in tokens.lower
+            for keyword in _NOTE_KEYWORDS
         ):
             return None
 
         # Extract information
         title = self.extract_title(message_text)
-        assignee_id, assignee_name = self.extract_assignee(
-            message_text, message.get("mentions", [])
+        assignee_id, assignee_name = self._extract_assignee(
+            tokens.mentions, message.get("mentions", [])
         )
-        due_date = self.extract_due_date(message_text, message.get("ts"))
+        due_date = self._extract_due_date(tokens.lower, message.get("ts"))
         project, topic = self.extract_project_topic(
             message_text, message.get("channel_name")
         )
@@ -233,44 +356,96 @@ class MessageIngestionService:
 
         # Check if this is a completion message
         status = ItemStatus.OPEN
-        if any(re.search(pattern, message_text.lower()) for pattern in self.COMPLETION_PATTERNS):
+        if any(pattern.search(message_text) for pattern in self.COMPLETION_PATTERNS):
             status = ItemStatus.COMPLETED
 
+        # Every row carries the same keys so a batch can go out as one INSERT
+        return {
+            "type": item_type,
+            "title": title,
+            "description": message_text,
+            "status": status,
+            "assigned_to_user_id": assignee_id,
+            "assigned_to_user_name": assignee_name,
+            "source_channel_id": channel_id,
+            "source_channel_name": message.get("channel_name"),
+            "source_thread_ts": thread_ts,
+            "source_url": source_url,
+            "priority": 0,
+            "workspace_id": workspace_id,
+            "raw_snippet": raw_snippet,
+            "source_message_ts": message_ts,
+            "requestor_user_id": requestor_id,
+            "requestor_user_name": requestor_name,
+            "created_by_user_id": requestor_id,
+            "project": project,
+            "topic": topic,
+            "due_date": due_date,
+        }
+
+    def _build_item_rows(
+        self,
+        messages: list[dict[str, Any]],
+        workspace_id: str | None = None,
+        thread_context: list[dict] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Parse a batch of messages, dropping the irrelevant ones."""
+        rows = []
+        for message in messages:
+            row = self._build_item_row(message, workspace_id, thread_context)
+            if row is not None:
+                rows.append(row)
+        return rows
+
+    async def ingest_message(
+        self,
+        message: dict[str, Any],
+        workspace_id: str | None = None,
+        thread_context: list[dict] | None = None,
+    ) -> AgendaItem | None:
+        """Ingest a Slack message and create/update agenda items.
+
+        Args:
+            message: Slack message dict with text, user, ts, channel, etc.
+            workspace_id: Workspace ID
+            thread_context: List of messages in the thread for context
+
+        Returns:
+            Created or updated AgendaItem, or None if not relevant
+        """
+        row = self._build_item_row(message, workspace_id, thread_context)
+        if row is None:
+            return None
+
         # Create agenda item
         item = await self.agenda_service.upsert_item(
-            item_type=item_type.value,
-            title=title,
-            description=message_text,
-            status=status.value,
-            assigned_to_user_id=assignee_id,
-            assigned_to_user_name=assignee_name,
-            source_channel_id=channel_id,
-            source_channel_name=message.get("channel_name"),
-            source_thread_ts=thread_ts,
-            source_url=source_url,
-            priority=0,
+            item_type=row["type"].value,
+            title=row["title"],
+            description=row["description"],
+            status=row["status"].value,
+            assigned_to_user_id=row["assigned_to_user_id"],
+            assigned_to_user_name=row["assigned_to_user_name"],
+            source_channel_id=row["source_channel_id"],
+            source_channel_name=row["source_channel_name"],
+            source_thread_ts=row["source_thread_ts"],
+            source_url=row["source_url"],
+            priority=row["priority"],
+            workspace_id=row["workspace_id"],
+            raw_snippet=row["raw_snippet"],
+            source_message_ts=row["source_message_ts"],
+            requestor_user_id=row["requestor_user_id"],
+            requestor_user_name=row["requestor_user_name"],
+            created_by_user_id=row["created_by_user_id"],
+            project=row["project"],
+            topic=row["topic"],
+            due_date=row["due_date"],
         )
 
-        # Update with additional fields via repository
-        async with self.agenda_service.get_repository() as repo:
-            item.workspace_id = workspace_id
-            item.raw_snippet = raw_snippet
-            item.source_message_ts = message_ts
-            item.requestor_user_id = requestor_id
-            item.requestor_user_name = requestor_name
-            item.created_by_user_id = requestor_id
-            item.project = project
-            item.topic = topic
-            item.due_date = due_date
-            item.due_at = due_date  # Alias
-            await repo.session.commit()
-            await repo.session.refresh(item)
-
         logger.info(
             "ingested_message",
             item_id=item.id,
-            item_type=item_type.value,
-            title=title[:50],
+            item_type=row["type"].value,
+            title=row["title"][:50],
         )
 
         return item
@@ -283,6 +458,9 @@ class MessageIngestionService:
         thread_ts: str | None = None,
     ) -> list[AgendaItem]:
         """Ingest all messages in a thread and create agenda items."""
+        if len(thread_messages) > 1:
+            return await self.ingest_thread_bulk(thread_messages, workspace_id)
+
         items = []
         for message in thread_messages:
             item = await self.ingest_message(
@@ -294,7 +472,116 @@ class MessageIngestionService:
                 items.append(item)
         return items
 
+    async def ingest_thread_bulk(
+        self,
+        thread_messages: list[dict[str, Any]],
+        workspace_id: str | None = None,
+    ) -> list[AgendaItem]:
+        """Ingest a thread with a single multi-row write in one transaction.
+
+        Large batches (``COPY_THRESHOLD`` items or more) use PostgreSQL COPY.
+
+        Args:
+            thread_messages: Slack message dicts in the thread
+            workspace_id: Workspace ID
+
+        Returns:
+            Created AgendaItems, in message order
+        """
+        # Parse off the event loop so it can keep serving other requests
+        rows = await asyncio.to_thread(
+            self._build_item_rows, thread_messages, workspace_id, thread_messages
+        )
+        if not rows:
+            return []
+
+        items = await self._write_rows(rows)
+
+        logger.info(
+            "ingested_thread",
+            messages=len(thread_messages),
+            items=len(items),
+        )
+
+        return items
+
+    async def ingest_messages(
+        self,
+        messages: list[dict[str, Any]],
+        workspace_id: str | None = None,
+    ) -> list[AgendaItem]:
+        """Ingest a batch of independent messages with one multi-row write.
+
+        Args:
+            messages: Slack message dicts with text, user, ts, channel, etc.
+            workspace_id: Workspace ID
+
+        Returns:
+            Created AgendaItems, in message order; irrelevant messages are skipped
+        """
+        rows = await asyncio.to_thread(self._build_item_rows, messages, workspace_id)
+        if not rows:
+            return []
+
+        items = await self._write_rows(rows)
+
+        logger.info("ingested_messages", messages=len(messages), items=len(items))
+
+        return items
+
+    async def ingest_backfill(
+        self,
+        messages: Iterable[dict[str, Any]],
+        workspace_id: str | None = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[AgendaItem]:
+        """Ingest a large message stream page by page.
+
+        Each page is parsed and written in its own session and transaction,
+        so neither the identity map nor the open transaction grows with the
+        size of the backfill. Messages repeated across overlapping history
+        pages (same channel and ts) are ingested once.
+
+        Args:
+            messages: Slack message dicts, consumed lazily
+            workspace_id: Workspace ID
+            page_size: Number of messages per page/transaction
+
+        Yields:
+            Created AgendaItems (detached), in message order
+        """
+        iterator = iter(messages)
+        seen: set[tuple[str | None, str | None]] = set()
+        pages = 0
+        while page := list(islice(iterator, page_size)):
+            pages += 1
+            fresh = []
+            for message in page:
+                key = (message.get("channel"), message.get("ts"))
+                if key not in seen:
+                    seen.add(key)
+                    fresh.append(message)
+            rows = await asyncio.to_thread(self._build_item_rows, fresh, workspace_id)
+            if not rows:
+                continue
+
+            for item in await self._write_rows(rows):
+                yield item
+
+        logger.info("ingested_backfill", pages=pages)
+
+    async def _write_rows(self, rows: list[dict[str, Any]]) -> list[AgendaItem]:
+        """Write parsed item rows in one transaction and detach the results."""
+        async with self.agenda_service.get_repository() as repo:
+            if len(rows) >= COPY_THRESHOLD:
+                items = await repo.copy_items(rows)
+            else:
+                items = await repo.insert_items(rows)
+            repo.session.expunge_all()
+        return items
+
 
+@lru_cache(maxsize=1)
 def get_ingestion_service() -> MessageIngestionService:
     """Get the global ingestion service instance."""
     return MessageIngestionService()
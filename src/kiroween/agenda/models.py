@@ -1,11 +1,32 @@
 """SQLAlchemy ORM models for the Agenda database."""
 
+import os
+import time
 import uuid
 from datetime import datetime
 from enum import Enum
-
-from sqlalchemy import DateTime, Enum as SQLEnum, ForeignKey, Integer, String, Text
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from functools import cache
+
+from sqlalchemy import (
+    DDL,
+    JSON,
+    CheckConstraint,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    Text,
+    TypeDecorator,
+    Uuid,
+    event,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.engine import Dialect
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, validates
 from sqlalchemy.sql import func
 
 
@@ -15,6 +36,21 @@ class Base(DeclarativeBase):
     pass
 
 
+# Trigram indexes below need pg_trgm; create it along with the schema
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+def _trigram_index(name: str, column: str) -> Index:
+    """GIN trigram index so ILIKE '%term%' on ``column`` can avoid a seq scan."""
+    return Index(
+        name, column, postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"}
+    ).ddl_if(dialect="postgresql")
+
+
 class ItemType(str, Enum):
     """Types of agenda items."""
 
@@ -39,22 +75,169 @@ class ItemStatus(str, Enum):
     DONE = "done"  # Alias for completed, kept for compatibility
 
 
+# Enum lookups by value are slow; the value sets are tiny and fixed, so
+# request-path coercions go through these memoized helpers
+@cache
+def to_item_type(value: str) -> ItemType:
+    """Coerce a string to ItemType."""
+    return ItemType(value)
+
+
+@cache
+def to_item_status(value: str) -> ItemStatus:
+    """Coerce a string to ItemStatus."""
+    return ItemStatus(value)
+
+
+class SmallIntEnum(TypeDecorator[Enum]):
+    """Store a Python Enum as a SMALLINT code.
+
+    The code is the member's position in the enum definition, so new
+    members must only ever be appended.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: type[Enum]) -> None:
+        super().__init__()
+        self.enum_class = enum_class
+        self._members = tuple(enum_class)
+        self._codes = {member: code for code, member in enumerate(self._members)}
+
+    def process_bind_param(self, value: Enum | str | None, dialect: Dialect) -> int | None:
+        if value is None:
+            return None
+        return self._codes[self.enum_class(value)]
+
+    def process_result_value(self, value: int | None, dialect: Dialect) -> Enum | None:
+        if value is None:
+            return None
+        return self._members[value]
+
+
+# Native 16-byte uuid on PostgreSQL; ids stay plain strings in Python
+UUID_STR = Uuid(as_uuid=False)
+
+# Native text[] on PostgreSQL; JSON lists elsewhere (e.g. SQLite in tests)
+StringList = ARRAY(String).with_variant(JSON(), "sqlite")
+
+# Native jsonb on PostgreSQL so the driver hands back parsed values
+JSONDocument = JSONB().with_variant(JSON(), "sqlite")
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    """ISO-format an optional datetime."""
+    return None if value is None else value.isoformat()
+
+
+_uuid7_last_ms = 0
+_uuid7_seq = 0
+
+
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered RFC 9562 UUIDv7.
+
+    The 12-bit rand_a field doubles as a sequence counter within a
+    millisecond, so ids from this process are strictly increasing and new
+    rows append to the right edge of the primary key index.
+    """
+    global _uuid7_last_ms, _uuid7_seq
+
+    ms = time.time_ns() // 1_000_000
+    if ms > _uuid7_last_ms:
+        _uuid7_last_ms = ms
+        _uuid7_seq = int.from_bytes(os.urandom(2)) & 0x3FF
+    else:
+        _uuid7_seq += 1
+        if _uuid7_seq > 0xFFF:
+            _uuid7_last_ms += 1
+            _uuid7_seq = 0
+
+    rand_b = int.from_bytes(os.urandom(8)) & 0x3FFF_FFFF_FFFF_FFFF
+    value = (
+        (_uuid7_last_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | _uuid7_seq << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
+
+
 def generate_uuid() -> str:
-    """Generate a new UUID string."""
-    return str(uuid.uuid4())
+    """Generate a new time-ordered UUID string."""
+    return str(uuid7())
 
 
 class AgendaItem(Base):
     """Core agenda item model for tracking tasks, decisions, and obligations."""
 
     __tablename__ = "agenda_items"
+    __table_args__ = (
+        # Queries are tenant-scoped, so composites lead with workspace_id
+        Index("ix_agenda_items_ws_assignee", "workspace_id", "assigned_to_user_id"),
+        Index("ix_agenda_items_ws_requestor", "workspace_id", "requestor_user_id"),
+        Index("ix_agenda_items_ws_project", "workspace_id", "project"),
+        Index("ix_agenda_items_ws_thread", "workspace_id", "source_thread_ts"),
+        Index("ix_agenda_items_ws_status_due", "workspace_id", "status", "due_date"),
+        # Open work per workspace by due date (codes: OPEN=0, IN_PROGRESS=1)
+        Index(
+            "ix_agenda_items_open_due",
+            "workspace_id",
+            "due_date",
+            postgresql_where=text("status IN (0, 1)"),
+        ),
+        # Digest queries: equality columns first, then the range column.
+        # Morning digest "due today" and per-user overdue/open task lists
+        Index(
+            "ix_agenda_items_user_type_status_due",
+            "assigned_to_user_id", "type", "status", "due_date",
+        ),
+        # End-of-day recap: tasks completed since midnight
+        Index(
+            "ix_agenda_items_user_type_status_completed",
+            "assigned_to_user_id", "type", "status", "completed_at",
+        ),
+        # While-you-were-away: watched channels in a created_at window
+        Index("ix_agenda_items_channel_created", "source_channel_id", "created_at"),
+        # Search listings: equality filters, then the ORDER BY column (a
+        # backward index scan serves DESC, so LIMIT stops early without a sort).
+        # Type-scoped searches newest-updated first (tasks with text, the
+        # structured search default order)
+        Index("ix_agenda_items_ws_type_updated", "workspace_id", "type", "updated_at"),
+        # Type-scoped searches newest-created first (decisions about a topic,
+        # open questions)
+        Index("ix_agenda_items_ws_type_created", "workspace_id", "type", "created_at"),
+        Index("ix_agenda_items_assignee_updated", "assigned_to_user_id", "updated_at"),
+        Index("ix_agenda_items_tags_gin", "tags", postgresql_using="gin"),
+        Index("ix_agenda_items_labels_gin", "labels", postgresql_using="gin"),
+        # Substring search (ILIKE '%q%') on free-text columns
+        _trigram_index("ix_agenda_items_title_trgm", "title"),
+        _trigram_index("ix_agenda_items_description_trgm", "description"),
+        _trigram_index("ix_agenda_items_project_trgm", "project"),
+        # Unassigned is always NULL, never '', so the open-unowned listing
+        # is a single IS NULL predicate this partial index can serve
+        Index(
+            "ix_agenda_items_unassigned_open",
+            "workspace_id",
+            postgresql_where=text("assigned_to_user_id IS NULL AND type = 0 AND status IN (0, 1)"),
+        ),
+        CheckConstraint(
+            "assigned_to_user_id IS NULL OR assigned_to_user_id <> ''",
+            name="ck_agenda_items_assignee_nonempty",
+        ),
+    )
+    # Fetch server-generated timestamps with INSERT/UPDATE ... RETURNING
+    # instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=generate_uuid
+        UUID_STR, primary_key=True, default=generate_uuid
     )
-    type: Mapped[ItemType] = mapped_column(SQLEnum(ItemType), nullable=False)
+    type: Mapped[ItemType] = mapped_column(SmallIntEnum(ItemType), nullable=False)
     status: Mapped[ItemStatus] = mapped_column(
-        SQLEnum(ItemStatus), default=ItemStatus.OPEN, nullable=False
+        SmallIntEnum(ItemStatus), default=ItemStatus.OPEN, nullable=False
     )
 
     title: Mapped[str] = mapped_column(String(500), nullable=False)
@@ -91,20 +274,21 @@ class AgendaItem(Base):
     topic: Mapped[str | None] = mapped_column(
         String(200), nullable=True
     )
-    labels: Mapped[str | None] = mapped_column(
-        String(500), nullable=True
+    labels: Mapped[list[str] | None] = mapped_column(
+        StringList, nullable=True
     )
 
     # Scheduling
     due_date: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    # Legacy alias of due_date, generated by the database; never written
     due_at: Mapped[datetime | None] = mapped_column(
-        DateTime, nullable=True
+        DateTime, Computed("due_date", persisted=True), nullable=True
     )
 
     # Metadata
-    priority: Mapped[int] = mapped_column(Integer, default=0)  # 0=normal, 1=high, 2=urgent
-    tags: Mapped[str | None] = mapped_column(
-        String(500), nullable=True
+    priority: Mapped[int] = mapped_column(SmallInteger, default=0)  # 0=normal, 1=high, 2=urgent
+    tags: Mapped[list[str] | None] = mapped_column(
+        StringList, nullable=True
     )
 
     # Timestamps
@@ -117,10 +301,22 @@ class AgendaItem(Base):
     completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
     # Relationships
+    # Relationships raise on implicit lazy loads; callers opt in with
+    # selectinload() so a stray attribute access can't become an N+1.
+    # Deletes lean on the ON DELETE CASCADE foreign key instead of loading
+    # the collection first.
     history: Mapped[list["AgendaItemHistory"]] = relationship(
-        back_populates="item", cascade="all, delete-orphan"
+        back_populates="item",
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
     )
 
+    @validates("assigned_to_user_id")
+    def _normalize_assignee(self, key: str, value: str | None) -> str | None:
+        """Store an empty assignee as NULL."""
+        return value or None
+
     def to_dict(self) -> dict:
         """Convert the model to a dictionary."""
         return {
@@ -143,14 +339,14 @@ class AgendaItem(Base):
             "created_by_user_id": self.created_by_user_id,
             "project": self.project,
             "topic": self.topic,
-            "labels": self.labels.split(",") if self.labels else [],
-            "due_date": self.due_date.isoformat() if self.due_date else None,
-            "due_at": self.due_at.isoformat() if self.due_at else None,
+            "labels": self.labels or [],
+            "due_date": _isoformat(self.due_date),
+            "due_at": _isoformat(self.due_at),
             "priority": self.priority,
-            "tags": self.tags.split(",") if self.tags else [],
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "tags": self.tags or [],
+            "created_at": _isoformat(self.created_at),
+            "updated_at": _isoformat(self.updated_at),
+            "completed_at": _isoformat(self.completed_at),
         }
 
 
@@ -161,7 +357,7 @@ class AgendaItemHistory(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     item_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("agenda_items.id", ondelete="CASCADE"), nullable=False
+        UUID_STR, ForeignKey("agenda_items.id", ondelete="CASCADE"), nullable=False
     )
     field_changed: Mapped[str] = mapped_column(String(50), nullable=False)
     old_value: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -171,7 +367,7 @@ class AgendaItemHistory(Base):
     )
     changed_by: Mapped[str | None] = mapped_column(String(50), nullable=True)  # Slack user_id
 
-    item: Mapped["AgendaItem"] = relationship(back_populates="history")
+    item: Mapped["AgendaItem"] = relationship(back_populates="history", lazy="raise")
 
 
 class UserProfile(Base):
@@ -180,20 +376,20 @@ class UserProfile(Base):
     __tablename__ = "user_profiles"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=generate_uuid
+        UUID_STR, primary_key=True, default=generate_uuid
     )
     workspace_id: Mapped[str] = mapped_column(String(50), nullable=False)
     user_id: Mapped[str] = mapped_column(String(50), nullable=False, unique=True)
     user_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
     user_email: Mapped[str | None] = mapped_column(String(200), nullable=True)
 
-    # Notification preferences (JSON stored as text)
-    notification_preferences: Mapped[str | None] = mapped_column(
-        Text, nullable=True
+    # Notification preferences
+    notification_preferences: Mapped[dict | None] = mapped_column(
+        JSONDocument, nullable=True
     )
     focus_mode_enabled: Mapped[bool] = mapped_column(default=False)
-    focus_mode_settings: Mapped[str | None] = mapped_column(
-        Text, nullable=True
+    focus_mode_settings: Mapped[dict | None] = mapped_column(
+        JSONDocument, nullable=True
     )
 
     # Timestamps
@@ -211,25 +407,25 @@ class WorkspaceConfig(Base):
     __tablename__ = "workspace_configs"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=generate_uuid
+        UUID_STR, primary_key=True, default=generate_uuid
     )
     workspace_id: Mapped[str] = mapped_column(String(50), nullable=False, unique=True)
     workspace_name: Mapped[str | None] = mapped_column(String(200), nullable=True)
 
-    # Watched channels (JSON array stored as text)
-    watched_channels: Mapped[str | None] = mapped_column(
-        Text, nullable=True
+    # Watched channels (JSON arrays of channel ids)
+    watched_channels: Mapped[list[str] | None] = mapped_column(
+        JSONDocument, nullable=True
     )
-    important_channels: Mapped[str | None] = mapped_column(
-        Text, nullable=True
+    important_channels: Mapped[list[str] | None] = mapped_column(
+        JSONDocument, nullable=True
     )
-    ignored_channels: Mapped[str | None] = mapped_column(
-        Text, nullable=True
+    ignored_channels: Mapped[list[str] | None] = mapped_column(
+        JSONDocument, nullable=True
     )
 
-    # Configuration (JSON stored as text)
-    config: Mapped[str | None] = mapped_column(
-        Text, nullable=True
+    # Configuration
+    config: Mapped[dict | None] = mapped_column(
+        JSONDocument, nullable=True
     )
 
     # Timestamps
@@ -247,7 +443,7 @@ class View(Base):
     __tablename__ = "views"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=generate_uuid
+        UUID_STR, primary_key=True, default=generate_uuid
     )
     workspace_id: Mapped[str] = mapped_column(String(50), nullable=False)
     user_id: Mapped[str | None] = mapped_column(
@@ -257,9 +453,9 @@ class View(Base):
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     is_predefined: Mapped[bool] = mapped_column(default=False)
 
-    # Filter criteria (JSON stored as text)
-    filters: Mapped[str] = mapped_column(
-        Text, nullable=False
+    # Filter criteria
+    filters: Mapped[dict] = mapped_column(
+        JSONDocument, nullable=False
     )
 
     # Timestamps
@@ -277,7 +473,7 @@ class ThreadTitle(Base):
     __tablename__ = "thread_titles"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=generate_uuid
+        UUID_STR, primary_key=True, default=generate_uuid
     )
     workspace_id: Mapped[str] = mapped_column(String(50), nullable=False)
     channel_id: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -305,13 +501,15 @@ class Decision(Base):
     """Extracted decisions from threads."""
 
     __tablename__ = "decisions"
+    # Decisions are batch-inserted; RETURNING fills their timestamps in-band
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=generate_uuid
+        UUID_STR, primary_key=True, default=generate_uuid
     )
     workspace_id: Mapped[str] = mapped_column(String(50), nullable=False)
     agenda_item_id: Mapped[str | None] = mapped_column(
-        String(36), ForeignKey("agenda_items.id", ondelete="SET NULL"), nullable=True
+        UUID_STR, ForeignKey("agenda_items.id", ondelete="SET NULL"), nullable=True
     )
     thread_ts: Mapped[str | None] = mapped_column(String(50), nullable=True)
     channel_id: Mapped[str | None] = mapped_column(String(50), nullable=True)
@@ -321,8 +519,8 @@ class Decision(Base):
 
     decision_text: Mapped[str] = mapped_column(Text, nullable=False)
     project: Mapped[str | None] = mapped_column(String(200), nullable=True)
-    involved_user_ids: Mapped[str | None] = mapped_column(
-        String(500), nullable=True
+    involved_user_ids: Mapped[list[str] | None] = mapped_column(
+        StringList, nullable=True
     )
 
     # Timestamps
@@ -333,16 +531,21 @@ class Decision(Base):
         DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
     )
 
-    agenda_item: Mapped["AgendaItem"] = relationship()
+    agenda_item: Mapped["AgendaItem"] = relationship(lazy="raise")
 
 
 class FAQAnswer(Base):
     """FAQ and canonical answers derived from threads."""
 
     __tablename__ = "faq_answers"
+    __table_args__ = (
+        _trigram_index("ix_faq_answers_question_trgm", "question"),
+        _trigram_index("ix_faq_answers_answer_trgm", "answer"),
+        Index("ix_faq_answers_tags_gin", "tags", postgresql_using="gin"),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=generate_uuid
+        UUID_STR, primary_key=True, default=generate_uuid
     )
     workspace_id: Mapped[str] = mapped_column(String(50), nullable=False)
     question: Mapped[str] = mapped_column(Text, nullable=False)
@@ -352,7 +555,9 @@ class FAQAnswer(Base):
     source_message_ts: Mapped[str | None] = mapped_column(String(50), nullable=True)
 
     # Metadata
-    tags: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    tags: Mapped[list[str] | None] = mapped_column(
+        StringList, nullable=True
+    )
     usage_count: Mapped[int] = mapped_column(Integer, default=0)
     is_canonical: Mapped[bool] = mapped_column(default=False)
 
@@ -363,3 +568,16 @@ class FAQAnswer(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
     )
+
+
+# Full-text document for FAQ search. Constants are inlined rather than bound
+# so queries repeat the indexed expression exactly and the planner can use it.
+FAQ_SEARCH_TSV = func.to_tsvector(
+    text("'english'"),
+    func.coalesce(FAQAnswer.question, text("''"))
+    .concat(text("' '"))
+    .concat(func.coalesce(FAQAnswer.answer, text("''"))),
+)
+Index(
+    "ix_faq_answers_search_tsv", FAQ_SEARCH_TSV, postgresql_using="gin"
+).ddl_if(dialect="postgresql")
@@ -1,10 +1,13 @@
 """Notifications and digest generation service."""
 
-import json
-from datetime import datetime, timedelta
+from collections import defaultdict
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
-from sqlalchemy import and_, select
+from sqlalchemy import Select, and_, bindparam, or_, select
+from sqlalchemy.orm import raiseload
 
 from kiroween.agenda.models import AgendaItem, ItemStatus, ItemType, UserProfile
 from kiroween.agenda.repository import AgendaRepository
@@ -13,6 +16,99 @@ from kiroween.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Digests only render item columns, so history is not preloaded; any lazy
+# load raises instead of silently issuing a query per item
+_DIGEST_ITEM_OPTIONS = (raiseload("*"),)
+
+_OPEN_STATUSES = (ItemStatus.OPEN, ItemStatus.IN_PROGRESS)
+
+# Title suffix per priority in digest messages (1 = high, 2 = urgent)
+_PRIORITY_SUFFIX = {1: " 🟡", 2: " 🔴"}
+
+
+def _utcnow() -> datetime:
+    """Current UTC time as a naive datetime, matching the stored columns."""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def _parse_quiet_hours(quiet_hours: Any) -> tuple[int, int, bool] | None:
+    """Parse quiet hours into (start_minute, end_minute, overnight), or None."""
+    if not quiet_hours:
+        return None
+
+    try:
+        start_hour, start_min = map(int, quiet_hours.get("start", "22:00").split(":"))
+        end_hour, end_min = map(int, quiet_hours.get("end", "08:00").split(":"))
+    except (ValueError, AttributeError):
+        return None
+
+    start_time = start_hour * 60 + start_min
+    end_time = end_hour * 60 + end_min
+    return start_time, end_time, start_time > end_time
+
+
+def _with_quiet_minutes(preferences: dict[str, Any]) -> dict[str, Any]:
+    """Cache the parsed quiet hours on a preferences dict the loader just built."""
+    preferences["_quiet_minutes"] = _parse_quiet_hours(preferences.get("quiet_hours"))
+    return preferences
+
+
+# Digest rows are streamed from a server-side cursor in batches of this size
+_DIGEST_YIELD_PER = 100
+
+
+def _digest_statements(
+    stmt: Select[AgendaItem],
+) -> tuple[Select[AgendaItem], Select[AgendaItem]]:
+    """Return (all workspaces, single workspace) variants of a digest query."""
+    stmt = stmt.options(*_DIGEST_ITEM_OPTIONS).execution_options(
+        yield_per=_DIGEST_YIELD_PER
+    )
+    return stmt, stmt.where(AgendaItem.workspace_id == bindparam("workspace_id"))
+
+
+# Digest queries are built once with bind parameters and indexed by
+# "workspace_id given"; each call only supplies values.
+# Morning digest: one query for all three sections, bucketed in Python
+_MORNING_DIGEST_STMTS = _digest_statements(
+    select(AgendaItem).where(
+        or_(
+            and_(
+                AgendaItem.type == ItemType.TASK,
+                AgendaItem.assigned_to_user_id == bindparam("user_id"),
+                AgendaItem.due_date >= bindparam("today_start"),
+                AgendaItem.due_date < bindparam("today_end"),
+                AgendaItem.status.in_(_OPEN_STATUSES),
+            ),
+            and_(
+                AgendaItem.type.in_([ItemType.TASK, ItemType.DECISION]),
+                AgendaItem.created_at >= bindparam("yesterday_start"),
+                or_(
+                    AgendaItem.assigned_to_user_id == bindparam("user_id"),
+                    AgendaItem.requestor_user_id == bindparam("user_id"),
+                ),
+            ),
+        )
+    )
+)
+
+# End-of-day recap: open tasks plus those completed since midnight
+_END_OF_DAY_STMTS = _digest_statements(
+    select(AgendaItem).where(
+        and_(
+            AgendaItem.type == ItemType.TASK,
+            AgendaItem.assigned_to_user_id == bindparam("user_id"),
+            or_(
+                AgendaItem.status.in_(_OPEN_STATUSES),
+                and_(
+                    AgendaItem.status == ItemStatus.COMPLETED,
+                    AgendaItem.completed_at >= bindparam("today_start"),
+                ),
+            ),
+        )
+    )
+)
+
 
 class NotificationPolicyEngine:
     """Engine for deciding notification delivery based on user preferences."""
@@ -20,9 +116,14 @@ class NotificationPolicyEngine:
     def __init__(self):
         self.agenda_service = AgendaService()
 
-    async def get_user_preferences(self, user_id: str) -> dict[str, Any]:
+    async def get_user_preferences(
+        self,
+        user_id: str,
+        *,
+        repo: AgendaRepository | None = None,
+    ) -> dict[str, Any]:
         """Get user notification preferences."""
-        async with self.agenda_service.get_repository() as repo:
+        async with self.agenda_service.use_repository(repo) as repo:
             result = await repo.session.execute(
                 select(UserProfile).where(UserProfile.user_id == user_id)
             )
@@ -30,16 +131,44 @@ class NotificationPolicyEngine:
             if not profile or not profile.notification_preferences:
                 return self._default_preferences()
 
-            return json.loads(profile.notification_preferences)
+            return _with_quiet_minutes(dict(profile.notification_preferences))
+
+    async def get_users_preferences(
+        self,
+        user_ids: list[str],
+        *,
+        repo: AgendaRepository | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Get notification preferences for many users with one query."""
+        unique_ids = list(dict.fromkeys(user_ids))
+        if not unique_ids:
+            return {}
+
+        async with self.agenda_service.use_repository(repo) as repo:
+            result = await repo.session.execute(
+                select(UserProfile.user_id, UserProfile.notification_preferences).where(
+                    UserProfile.user_id.in_(unique_ids)
+                )
+            )
+            stored = {user_id: raw for user_id, raw in result.all() if raw}
+
+        return {
+            user_id: (
+                _with_quiet_minutes(dict(stored[user_id]))
+                if user_id in stored
+                else self._default_preferences()
+            )
+            for user_id in unique_ids
+        }
 
     def _default_preferences(self) -> dict[str, Any]:
         """Default notification preferences."""
-        return {
+        return _with_quiet_minutes({
             "instant_for": ["direct_tasks", "urgent_customer_issues"],
             "batch_everything_else": True,
             "quiet_hours": {"start": "22:00", "end": "08:00"},
             "focus_mode": False,
-        }
+        })
 
     def should_notify_instantly(
         self,
@@ -68,41 +197,72 @@ class NotificationPolicyEngine:
 
         return False
 
-    def is_quiet_hours(self, preferences: dict[str, Any]) -> bool:
-        """Check if current time is within quiet hours."""
-        quiet_hours = preferences.get("quiet_hours")
-        if not quiet_hours:
+    def is_quiet_hours(
+        self,
+        preferences: dict[str, Any],
+        now: datetime | None = None,
+    ) -> bool:
+        """Check if ``now`` (default: current UTC time) is within quiet hours."""
+        quiet_minutes: tuple[int, int, bool] | None
+        if "_quiet_minutes" in preferences:
+            quiet_minutes = preferences["_quiet_minutes"]
+        else:
+            quiet_minutes = _parse_quiet_hours(preferences.get("quiet_hours"))
+        if quiet_minutes is None:
             return False
 
-        now = datetime.utcnow()
-        start_str = quiet_hours.get("start", "22:00")
-        end_str = quiet_hours.get("end", "08:00")
-
-        try:
-            start_hour, start_min = map(int, start_str.split(":"))
-            end_hour, end_min = map(int, end_str.split(":"))
-
-            current_time = now.hour * 60 + now.minute
-            start_time = start_hour * 60 + start_min
-            end_time = end_hour * 60 + end_min
-
-            if start_time > end_time:  # Overnight quiet hours
-                return current_time >= start_time or current_time < end_time
-            else:
-                return start_time <= current_time < end_time
-        except (ValueError, AttributeError):
-            return False
+        # Only read the clock when quiet hours are actually configured
+        start_time, end_time, overnight = quiet_minutes
+        if now is None:
+            now = _utcnow()
+        current_time = now.hour * 60 + now.minute
+        if overnight:
+            return current_time >= start_time or current_time < end_time
+        return start_time <= current_time < end_time
 
     async def decide_notification_action(
         self,
         item: AgendaItem,
         user_id: str,
+        now: datetime | None = None,
+        *,
+        repo: AgendaRepository | None = None,
     ) -> str:
         """Decide notification action: 'instant', 'batch', or 'silent'."""
-        preferences = await self.get_user_preferences(user_id)
+        preferences = await self.get_user_preferences(user_id, repo=repo)
+        return self._decide_action(item, preferences, now)
 
+    async def decide_notification_actions(
+        self,
+        items: list[tuple[AgendaItem, str]],
+        now: datetime | None = None,
+        *,
+        repo: AgendaRepository | None = None,
+    ) -> list[str]:
+        """Decide notification actions for a burst of (item, user_id) pairs.
+
+        Preferences for all users are fetched with a single IN query and
+        parsed once per user, instead of one lookup per item, and every
+        decision uses the same ``now``.
+        """
+        preferences = await self.get_users_preferences(
+            [user_id for _, user_id in items], repo=repo
+        )
+        if now is None:
+            now = _utcnow()
+        return [
+            self._decide_action(item, preferences[user_id], now) for item, user_id in items
+        ]
+
+    def _decide_action(
+        self,
+        item: AgendaItem,
+        preferences: dict[str, Any],
+        now: datetime | None = None,
+    ) -> str:
+        """Decide the notification action for an item given loaded preferences."""
         # Check quiet hours
-        if self.is_quiet_hours(preferences):
+        if self.is_quiet_hours(preferences, now):
             return "batch"
 
         # Check if should notify instantly
@@ -117,7 +277,12 @@ class NotificationPolicyEngine:
 
 
 class DigestService:
-    """Service for generating digests and summaries."""
+    """Service for generating digests and summaries.
+
+    Each generator accepts an optional open ``repo`` so a caller building
+    several digests (or mixing digests with preference lookups) can run
+    them all on one session.
+    """
 
     def __init__(self):
         self.agenda_service = AgendaService()
@@ -126,28 +291,52 @@ class DigestService:
         self,
         user_id: str,
         workspace_id: str | None = None,
+        now: datetime | None = None,
+        *,
+        repo: AgendaRepository | None = None,
     ) -> dict[str, Any]:
-        """Generate morning digest: tasks due today, new tasks, important decisions."""
-        now = datetime.utcnow()
+        """Generate morning digest: tasks due today, new tasks, important decisions.
+
+        All window boundaries derive from a single ``now`` (default: current
+        UTC time), so the sections of one digest agree with each other.
+        """
+        if now is None:
+            now = _utcnow()
         today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        today_end = today_start + timedelta(days=1)
         yesterday_start = today_start - timedelta(days=1)
 
-        async with self.agenda_service.get_repository() as repo:
-            # Tasks due today
-            tasks_due_today = await self._get_tasks_due_on_date(
-                repo, user_id, today_start, workspace_id
-            )
-
-            # New tasks created in last 24h
-            new_tasks = await self._get_new_items_since(
-                repo, user_id, yesterday_start, ItemType.TASK, workspace_id
-            )
+        stmt = _MORNING_DIGEST_STMTS[bool(workspace_id)]
+        params = {
+            "user_id": user_id,
+            "today_start": today_start,
+            "today_end": today_end,
+            "yesterday_start": yesterday_start,
+            "workspace_id": workspace_id,
+        }
 
-            # Important decisions since yesterday
-            decisions = await self._get_new_items_since(
-                repo, user_id, yesterday_start, ItemType.DECISION, workspace_id
-            )
-            important_decisions = [d for d in decisions if d.priority >= 1]
+        tasks_due_today = []
+        new_tasks = []
+        important_decisions = []
+        async with self.agenda_service.use_repository(repo) as repo:
+            items = await repo.session.stream_scalars(stmt, params)
+            async for item in items:
+                is_new = item.created_at >= yesterday_start and user_id in (
+                    item.assigned_to_user_id,
+                    item.requestor_user_id,
+                )
+                if item.type == ItemType.TASK:
+                    if (
+                        item.assigned_to_user_id == user_id
+                        and item.status in _OPEN_STATUSES
+                        and item.due_date is not None
+                        and today_start <= item.due_date < today_end
+                    ):
+                        tasks_due_today.append(item)
+                    if is_new:
+                        new_tasks.append(item)
+                elif is_new and item.priority >= 1:
+                    important_decisions.append(item)
 
         return {
             "tasks_due_today": tasks_due_today,
@@ -160,22 +349,38 @@ class DigestService:
         self,
         user_id: str,
         workspace_id: str | None = None,
+        now: datetime | None = None,
+        *,
+        repo: AgendaRepository | None = None,
     ) -> dict[str, Any]:
-        """Generate end-of-day recap: completed tasks, still open, overdue."""
-        now = datetime.utcnow()
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        """Generate end-of-day recap: completed tasks, still open, overdue.
 
-        async with self.agenda_service.get_repository() as repo:
-            # Tasks completed today
-            completed_today = await self._get_completed_today(
-                repo, user_id, today_start, workspace_id
-            )
+        All window boundaries derive from a single ``now`` (default: current
+        UTC time), so the sections of one digest agree with each other.
+        """
+        if now is None:
+            now = _utcnow()
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
-            # Still open tasks
-            open_tasks = await self._get_open_tasks(repo, user_id, workspace_id)
+        stmt = _END_OF_DAY_STMTS[bool(workspace_id)]
+        params = {
+            "user_id": user_id,
+            "today_start": today_start,
+            "workspace_id": workspace_id,
+        }
 
-            # Overdue tasks
-            overdue_tasks = await self._get_overdue_tasks(repo, user_id, workspace_id)
+        completed_today = []
+        open_tasks = []
+        overdue_tasks = []
+        async with self.agenda_service.use_repository(repo) as repo:
+            items = await repo.session.stream_scalars(stmt, params)
+            async for item in items:
+                if item.status == ItemStatus.COMPLETED:
+                    completed_today.append(item)
+                    continue
+                open_tasks.append(item)
+                if item.due_date is not None and item.due_date < now:
+                    overdue_tasks.append(item)
 
         return {
             "completed_today": completed_today,
@@ -191,10 +396,12 @@ class DigestService:
         end_time: datetime,
         workspace_id: str | None = None,
         channel_ids: list[str] | None = None,
+        *,
+        repo: AgendaRepository | None = None,
     ) -> dict[str, Any]:
         """Generate summary of changes in watched channels during time window."""
-        async with self.agenda_service.get_repository() as repo:
-            stmt = select(AgendaItem).where(
+        async with self.agenda_service.use_repository(repo) as repo:
+            stmt = select(AgendaItem).options(*_DIGEST_ITEM_OPTIONS).where(
                 and_(
                     AgendaItem.created_at >= start_time,
                     AgendaItem.created_at <= end_time,
@@ -217,184 +424,85 @@ class DigestService:
             )
 
             stmt = stmt.order_by(AgendaItem.created_at.desc())
-            result = await repo.session.execute(stmt)
-            items = list(result.scalars().all())
+            items = await repo.session.stream_scalars(
+                stmt.execution_options(yield_per=_DIGEST_YIELD_PER)
+            )
 
             # Group by type
-            by_type = {}
-            for item in items:
-                item_type = item.type.value
-                if item_type not in by_type:
-                    by_type[item_type] = []
-                by_type[item_type].append(item)
+            by_type = defaultdict(list)
+            total_count = 0
+            async for item in items:
+                total_count += 1
+                by_type[item.type.value].append(item)
 
         return {
-            "items": by_type,
-            "total_count": len(items),
+            "items": dict(by_type),
+            "total_count": total_count,
             "time_window": {
                 "start": start_time.isoformat(),
                 "end": end_time.isoformat(),
             },
         }
 
-    async def format_digest_for_slack(
+    def format_digest_for_slack(
         self,
         digest: dict[str, Any],
         digest_type: str,
     ) -> str:
         """Format a digest as a Slack message."""
-        lines = [f"*{digest_type.replace('_', ' ').title()}*\n"]
-
+        header = f"*{digest_type.replace('_', ' ').title()}*\n"
         if digest_type == "morning_digest":
-            if tasks_due := digest.get("tasks_due_today"):
-                lines.append(f"\n*Tasks Due Today ({len(tasks_due)}):*")
-                for task in tasks_due[:10]:
-                    priority = " 🔴" if task.priority == 2 else " 🟡" if task.priority == 1 else ""
-                    lines.append(f"• {task.title}{priority}")
-
-            if new_tasks := digest.get("new_tasks_24h"):
-                lines.append(f"\n*New Tasks (24h) ({len(new_tasks)}):*")
-                for task in new_tasks[:10]:
-                    lines.append(f"• {task.title}")
-
-            if decisions := digest.get("important_decisions_24h"):
-                lines.append(f"\n*Important Decisions (24h) ({len(decisions)}):*")
-                for decision in decisions[:5]:
-                    lines.append(f"• {decision.title}")
-
+            body = _format_morning_digest(digest)
         elif digest_type == "end_of_day":
-            if completed := digest.get("completed_today"):
-                lines.append(f"\n*Completed Today ({len(completed)}):*")
-                for task in completed[:10]:
-                    lines.append(f"✅ {task.title}")
+            body = _format_end_of_day(digest)
+        else:
+            body = iter(())
+        return "\n".join((header, *body))
 
-            if open_tasks := digest.get("still_open"):
-                lines.append(f"\n*Still Open ({len(open_tasks)}):*")
-                for task in open_tasks[:10]:
-                    lines.append(f"📋 {task.title}")
 
-            if overdue := digest.get("overdue"):
-                lines.append(f"\n*⚠️ Overdue ({len(overdue)}):*")
-                for task in overdue[:10]:
-                    lines.append(f"🔴 {task.title}")
+def _format_morning_digest(digest: dict[str, Any]) -> Iterator[str]:
+    """Yield the Slack lines for a morning digest."""
+    if tasks_due := digest.get("tasks_due_today"):
+        yield f"\n*Tasks Due Today ({len(tasks_due)}):*"
+        for task in tasks_due[:10]:
+            yield f"• {task.title}{_PRIORITY_SUFFIX.get(task.priority, '')}"
 
-        return "\n".join(lines)
+    if new_tasks := digest.get("new_tasks_24h"):
+        yield f"\n*New Tasks (24h) ({len(new_tasks)}):*"
+        for task in new_tasks[:10]:
+            yield f"• {task.title}"
 
-    async def _get_tasks_due_on_date(
-        self,
-        repo: AgendaRepository,
-        user_id: str,
-        date: datetime,
-        workspace_id: str | None = None,
-    ) -> list[AgendaItem]:
-        """Get tasks due on a specific date."""
-        date_end = date + timedelta(days=1)
-        stmt = select(AgendaItem).where(
-            and_(
-                AgendaItem.type == ItemType.TASK,
-                AgendaItem.assigned_to_user_id == user_id,
-                AgendaItem.due_date >= date,
-                AgendaItem.due_date < date_end,
-                AgendaItem.status.in_([ItemStatus.OPEN, ItemStatus.IN_PROGRESS]),
-            )
-        )
-        if workspace_id:
-            stmt = stmt.where(AgendaItem.workspace_id == workspace_id)
-        result = await repo.session.execute(stmt)
-        return list(result.scalars().all())
+    if decisions := digest.get("important_decisions_24h"):
+        yield f"\n*Important Decisions (24h) ({len(decisions)}):*"
+        for decision in decisions[:5]:
+            yield f"• {decision.title}"
 
-    async def _get_new_items_since(
-        self,
-        repo: AgendaRepository,
-        user_id: str,
-        since: datetime,
-        item_type: ItemType,
-        workspace_id: str | None = None,
-    ) -> list[AgendaItem]:
-        """Get new items of a type since a date."""
-        stmt = select(AgendaItem).where(
-            and_(
-                AgendaItem.type == item_type,
-                AgendaItem.created_at >= since,
-                or_(
-                    AgendaItem.assigned_to_user_id == user_id,
-                    AgendaItem.requestor_user_id == user_id,
-                ),
-            )
-        )
-        if workspace_id:
-            stmt = stmt.where(AgendaItem.workspace_id == workspace_id)
-        result = await repo.session.execute(stmt)
-        return list(result.scalars().all())
 
-    async def _get_completed_today(
-        self,
-        repo: AgendaRepository,
-        user_id: str,
-        today_start: datetime,
-        workspace_id: str | None = None,
-    ) -> list[AgendaItem]:
-        """Get tasks completed today."""
-        stmt = select(AgendaItem).where(
-            and_(
-                AgendaItem.type == ItemType.TASK,
-                AgendaItem.assigned_to_user_id == user_id,
-                AgendaItem.status == ItemStatus.COMPLETED,
-                AgendaItem.completed_at >= today_start,
-            )
-        )
-        if workspace_id:
-            stmt = stmt.where(AgendaItem.workspace_id == workspace_id)
-        result = await repo.session.execute(stmt)
-        return list(result.scalars().all())
+def _format_end_of_day(digest: dict[str, Any]) -> Iterator[str]:
+    """Yield the Slack lines for an end-of-day recap."""
+    if completed := digest.get("completed_today"):
+        yield f"\n*Completed Today ({len(completed)}):*"
+        for task in completed[:10]:
+            yield f"✅ {task.title}"
 
-    async def _get_open_tasks(
-        self,
-        repo: AgendaRepository,
-        user_id: str,
-        workspace_id: str | None = None,
-    ) -> list[AgendaItem]:
-        """Get open tasks."""
-        stmt = select(AgendaItem).where(
-            and_(
-                AgendaItem.type == ItemType.TASK,
-                AgendaItem.assigned_to_user_id == user_id,
-                AgendaItem.status.in_([ItemStatus.OPEN, ItemStatus.IN_PROGRESS]),
-            )
-        )
-        if workspace_id:
-            stmt = stmt.where(AgendaItem.workspace_id == workspace_id)
-        result = await repo.session.execute(stmt)
-        return list(result.scalars().all())
+    if open_tasks := digest.get("still_open"):
+        yield f"\n*Still Open ({len(open_tasks)}):*"
+        for task in open_tasks[:10]:
+            yield f"📋 {task.title}"
 
-    async def _get_overdue_tasks(
-        self,
-        repo: AgendaRepository,
-        user_id: str,
-        workspace_id: str | None = None,
-    ) -> list[AgendaItem]:
-        """Get overdue tasks."""
-        now = datetime.utcnow()
-        stmt = select(AgendaItem).where(
-            and_(
-                AgendaItem.type == ItemType.TASK,
-                AgendaItem.assigned_to_user_id == user_id,
-                AgendaItem.status.in_([ItemStatus.OPEN, ItemStatus.IN_PROGRESS]),
-                AgendaItem.due_date.isnot(None),
-                AgendaItem.due_date < now,
-            )
-        )
-        if workspace_id:
-            stmt = stmt.where(AgendaItem.workspace_id == workspace_id)
-        result = await repo.session.execute(stmt)
-        return list(result.scalars().all())
+    if overdue := digest.get("overdue"):
+        yield f"\n*⚠️ Overdue ({len(overdue)}):*"
+        for task in overdue[:10]:
+            yield f"🔴 {task.title}"
 
 
+@lru_cache(maxsize=1)
 def get_notification_engine() -> NotificationPolicyEngine:
     """Get the global notification policy engine."""
     return NotificationPolicyEngine()
 
 
+@lru_cache(maxsize=1)
 def get_digest_service() -> DigestService:
     """Get the global digest service."""
     return DigestService()
@@ -1,54 +1,160 @@
 """Data access layer for agenda items."""
 
+from collections.abc import Callable
+from dataclasses import dataclass, fields
 from datetime import datetime
+from functools import lru_cache
+from typing import Any
 
-from sqlalchemy import and_, or_, select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import (
+    Select,
+    StatementLambdaElement,
+    bindparam,
+    delete,
+    exists,
+    func,
+    insert,
+    lambda_stmt,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import selectinload
 
-from kiroween.agenda.models import AgendaItem, AgendaItemHistory, ItemStatus, ItemType
+from kiroween.agenda.models import (
+    AgendaItem,
+    AgendaItemHistory,
+    ItemStatus,
+    ItemType,
+    generate_uuid,
+    to_item_status,
+    to_item_type,
+)
 from kiroween.config import get_settings
 from kiroween.utils.errors import AgendaDBError
 from kiroween.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Primary-key lookup with history, built once
+_GET_BY_ID_WITH_HISTORY = (
+    select(AgendaItem)
+    .where(AgendaItem.id == bindparam("item_id"))
+    .options(selectinload(AgendaItem.history))
+)
 
-def get_async_engine():
-    """Create async database engine."""
+# search() with no filters, built once
+_SEARCH_ALL = (
+    select(AgendaItem).order_by(AgendaItem.updated_at.desc()).limit(bindparam("limit"))
+)
+
+# Column attributes upsert_item diffs and records history for
+_TRACKED_FIELDS = frozenset(
+    attr.key for attr in AgendaItem.__mapper__.column_attrs
+) - {"id"}
+
+# Maximum history rows per executemany round trip
+HISTORY_BATCH_SIZE = 1000
+
+# Columns filled in by the database rather than by upsert_item
+_SERVER_COLUMNS = ["created_at", "updated_at"]
+
+
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    """Get the process-wide async database engine (and its connection pool)."""
     settings = get_settings()
     return create_async_engine(
         settings.database_url,
         echo=settings.app_env == "development",
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_recycle=settings.database_pool_recycle,
+        query_cache_size=settings.database_query_cache_size,
+        # Reuse the most recently returned connection so a small working set
+        # stays warm and surplus connections idle out
+        pool_use_lifo=True,
         pool_pre_ping=True,
     )
 
 
+@lru_cache(maxsize=1)
 def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
-    """Create async session factory."""
+    """Get the shared async session factory bound to the cached engine."""
     engine = get_async_engine()
     return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+async def close_async_engine() -> None:
+    """Dispose of the cached engine's pool, e.g. on application shutdown."""
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+        get_async_session_factory.cache_clear()
+        get_async_engine.cache_clear()
+
+
+@dataclass(slots=True, frozen=True)
+class AgendaItemSummary:
+    """Read-only projection of an agenda item for list rendering."""
+
+    id: str
+    type: ItemType
+    status: ItemStatus
+    title: str
+    priority: int
+    assigned_to_user_name: str | None
+    created_at: datetime
+    updated_at: datetime
+
+
+_SUMMARY_COLUMNS = tuple(
+    getattr(AgendaItem, field.name) for field in fields(AgendaItemSummary)
+)
+
+
 class AgendaRepository:
-    """Data access layer for agenda items."""
+    """Data access layer for agenda items.
+
+    Methods flush but never commit; the transaction belongs to whoever
+    opened the session (see ``AgendaService.get_repository``).
+    """
 
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def get_by_id(self, item_id: str) -> AgendaItem | None:
-        """Get an agenda item by its ID."""
-        result = await self.session.execute(
-            select(AgendaItem).where(AgendaItem.id == item_id)
-        )
+    async def get_by_id(self, item_id: str, with_history: bool = False) -> AgendaItem | None:
+        """Get an agenda item by its ID.
+
+        ``history`` is lazy="raise"; pass ``with_history=True`` to load it
+        with one extra selectin query. It is a collection, so selectinload
+        is used rather than joinedload, which would repeat the item row per
+        history entry.
+
+        A plain lookup goes through ``session.get``, which returns an item
+        already in the identity map without a round trip.
+        """
+        if not with_history:
+            return await self.session.get(AgendaItem, item_id)
+        result = await self.session.execute(_GET_BY_ID_WITH_HISTORY, {"item_id": item_id})
         return result.scalar_one_or_none()
 
-    async def upsert_item(self, item_data: dict) -> AgendaItem:
+    async def upsert_item(self, item_data: dict, refresh: bool = False) -> AgendaItem:
         """Create or update an agenda item.
 
         Args:
             item_data: Dictionary containing item fields.
                        If 'id' is provided and exists, updates the item.
                        Otherwise, creates a new item.
+            refresh: Reload the server-populated columns after the flush.
+                     AgendaItem uses eager_defaults, so RETURNING already
+                     fills them where the database supports it.
 
         Returns:
             The created or updated AgendaItem.
@@ -62,48 +168,133 @@ class AgendaRepository:
                     # Track changes for history
                     changes = []
                     for key, value in item_data.items():
-                        if key == "id":
+                        if key not in _TRACKED_FIELDS:
                             continue
-                        if hasattr(existing, key):
-                            old_value = getattr(existing, key)
-                            if old_value != value:
-                                changes.append((key, str(old_value), str(value)))
-                                setattr(existing, key, value)
+                        old_value = getattr(existing, key)
+                        if old_value != value:
+                            changes.append((key, str(old_value), str(value)))
+                            setattr(existing, key, value)
 
                     # Add history entries for changes
-                    for field, old_val, new_val in changes:
-                        history = AgendaItemHistory(
-                            item_id=item_id,
-                            field_changed=field,
-                            old_value=old_val,
-                            new_value=new_val,
-                        )
-                        self.session.add(history)
-
-                    await self.session.commit()
-                    await self.session.refresh(existing)
+                    await self.add_history_batch([
+                        {
+                            "item_id": item_id,
+                            "field_changed": field,
+                            "old_value": old_val,
+                            "new_value": new_val,
+                        }
+                        for field, old_val, new_val in changes
+                    ])
+
+                    await self.session.flush()
+                    if refresh:
+                        await self.session.refresh(existing, attribute_names=_SERVER_COLUMNS)
                     logger.info("updated_agenda_item", item_id=item_id, changes=len(changes))
                     return existing
 
             # Create new item
             # Convert type and status strings to enums if needed
             if "type" in item_data and isinstance(item_data["type"], str):
-                item_data["type"] = ItemType(item_data["type"])
+                item_data["type"] = to_item_type(item_data["type"])
             if "status" in item_data and isinstance(item_data["status"], str):
-                item_data["status"] = ItemStatus(item_data["status"])
+                item_data["status"] = to_item_status(item_data["status"])
 
             item = AgendaItem(**item_data)
             self.session.add(item)
-            await self.session.commit()
-            await self.session.refresh(item)
+            await self.session.flush()
+            if refresh:
+                await self.session.refresh(item, attribute_names=_SERVER_COLUMNS)
             logger.info("created_agenda_item", item_id=item.id, title=item.title)
             return item
 
         except Exception as e:
-            await self.session.rollback()
             logger.error("agenda_db_error", error=str(e))
             raise AgendaDBError(f"Failed to upsert agenda item: {e}") from e
 
+    async def add_history_batch(self, rows: list[dict]) -> None:
+        """Insert history rows with executemany, without committing.
+
+        Rows are sent in chunks of ``HISTORY_BATCH_SIZE`` so one large
+        change set can't build an unbounded parameter list.
+        """
+        for start in range(0, len(rows), HISTORY_BATCH_SIZE):
+            await self.session.execute(
+                insert(AgendaItemHistory), rows[start:start + HISTORY_BATCH_SIZE]
+            )
+
+    async def insert_items(self, rows: list[dict]) -> list[AgendaItem]:
+        """Insert many new agenda items in one statement.
+
+        Args:
+            rows: Column values per item; every row must have the same keys.
+
+        Returns:
+            The created AgendaItems, in the order of ``rows``.
+        """
+        try:
+            result = await self.session.scalars(
+                insert(AgendaItem).returning(AgendaItem, sort_by_parameter_order=True),
+                rows,
+            )
+            items = list(result.all())
+            logger.info("created_agenda_items", count=len(items))
+            return items
+
+        except Exception as e:
+            logger.error("agenda_db_error", error=str(e))
+            raise AgendaDBError(f"Failed to insert agenda items: {e}") from e
+
+    async def copy_items(self, rows: list[dict[str, Any]]) -> list[AgendaItem]:
+        """Insert many new agenda items with PostgreSQL COPY.
+
+        Bypasses the ORM flush entirely; falls back to ``insert_items`` on
+        other databases.
+
+        Args:
+            rows: Column values per item; every row must have the same keys.
+
+        Returns:
+            The created AgendaItems, in the order of ``rows``.
+        """
+        conn = await self.session.connection()
+        if conn.dialect.name != "postgresql":
+            return await self.insert_items(rows)
+
+        try:
+            table = AgendaItem.__table__
+            rows = [{"id": generate_uuid(), **row} for row in rows]
+            columns = [table.c[key] for key in rows[0]]
+            processors = [column.type.bind_processor(conn.dialect) for column in columns]
+            records = [
+                tuple(
+                    processor(row[column.key]) if processor else row[column.key]
+                    for column, processor in zip(columns, processors)
+                )
+                for row in rows
+            ]
+
+            raw = await conn.get_raw_connection()
+            driver = raw.driver_connection
+            assert driver is not None, "COPY requires an open asyncpg connection"
+            await driver.copy_records_to_table(
+                AgendaItem.__tablename__,
+                records=records,
+                columns=[column.name for column in columns],
+            )
+
+            # Load the rows back so server defaults (timestamps) are populated
+            ids = [row["id"] for row in rows]
+            result = await self.session.scalars(
+                select(AgendaItem).where(AgendaItem.id.in_(ids))
+            )
+            items_by_id = {item.id: item for item in result}
+            logger.info("copied_agenda_items", count=len(ids))
+            return [items_by_id[item_id] for item_id in ids]
+
+        except Exception as e:
+            logger.error("agenda_db_error", error=str(e))
+            raise AgendaDBError(f"Failed to copy agenda items: {e}") from e
+
     async def search(
         self,
         query: str | None = None,
@@ -112,6 +303,7 @@ class AgendaRepository:
         assigned_to: str | None = None,
         channel_id: str | None = None,
         limit: int = 50,
+        tag: str | None = None,
     ) -> list[AgendaItem]:
         """Search agenda items with filters.
 
@@ -122,53 +314,118 @@ class AgendaRepository:
             assigned_to: Filter by assigned user ID
             channel_id: Filter by source channel
             limit: Maximum number of results
+            tag: Only items carrying this tag
 
         Returns:
             List of matching AgendaItems.
         """
-        stmt = select(AgendaItem)
+        if not any((query, item_type, status, assigned_to, channel_id, tag)):
+            return await self._search_all(limit)
+
+        conn = await self.session.connection()
+        stmt = self._search_statement(
+            lambda: select(AgendaItem),
+            query, item_type, status, assigned_to, channel_id, tag, limit,
+            conn.dialect.name,
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def search_summaries(
+        self,
+        query: str | None = None,
+        item_type: ItemType | None = None,
+        status: ItemStatus | None = None,
+        assigned_to: str | None = None,
+        channel_id: str | None = None,
+        limit: int = 50,
+        tag: str | None = None,
+    ) -> list[AgendaItemSummary]:
+        """Search agenda items, selecting only the columns list views render.
+
+        Skips ORM hydration and the large text columns; use ``search`` when
+        full items are needed.
+        """
+        conn = await self.session.connection()
+        stmt = self._search_statement(
+            lambda: select(*_SUMMARY_COLUMNS),
+            query, item_type, status, assigned_to, channel_id, tag, limit,
+            conn.dialect.name,
+        )
+        result = await self.session.execute(stmt)
+        return [AgendaItemSummary(*row) for row in result]
+
+    async def _search_all(self, limit: int) -> list[AgendaItem]:
+        """Unfiltered listing: the most recently updated items."""
+        result = await self.session.scalars(_SEARCH_ALL, {"limit": limit})
+        return list(result.all())
+
+    @staticmethod
+    def _search_statement(
+        base: Callable[[], Select],
+        query: str | None,
+        item_type: ItemType | None,
+        status: ItemStatus | None,
+        assigned_to: str | None,
+        channel_id: str | None,
+        tag: str | None,
+        limit: int,
+        dialect: str,
+    ) -> StatementLambdaElement:
+        """Build the filtered, ordered search query shared by the search methods.
 
-        conditions = []
+        Each filter is appended as its own lambda, so SQLAlchemy caches one
+        compiled statement per combination of filters and only re-binds the
+        values on later calls.
+        """
+        stmt = lambda_stmt(base)
         if query:
-            conditions.append(
-                or_(
-                    AgendaItem.title.ilike(f"%{query}%"),
-                    AgendaItem.description.ilike(f"%{query}%"),
-                )
+            pattern = f"%{query}%"
+            stmt += lambda s: s.where(
+                or_(AgendaItem.title.ilike(pattern), AgendaItem.description.ilike(pattern))
             )
         if item_type:
-            conditions.append(AgendaItem.type == item_type)
+            stmt += lambda s: s.where(AgendaItem.type == item_type)
         if status:
-            conditions.append(AgendaItem.status == status)
+            stmt += lambda s: s.where(AgendaItem.status == status)
         if assigned_to:
-            conditions.append(AgendaItem.assigned_to_user_id == assigned_to)
+            stmt += lambda s: s.where(AgendaItem.assigned_to_user_id == assigned_to)
         if channel_id:
-            conditions.append(AgendaItem.source_channel_id == channel_id)
-
-        if conditions:
-            stmt = stmt.where(and_(*conditions))
-
-        stmt = stmt.order_by(AgendaItem.updated_at.desc()).limit(limit)
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+            stmt += lambda s: s.where(AgendaItem.source_channel_id == channel_id)
+        if tag and dialect == "postgresql":
+            # tags @> ARRAY[tag], served by ix_agenda_items_tags_gin
+            tags = [tag]
+            stmt += lambda s: s.where(AgendaItem.tags.contains(tags))
+        elif tag:
+            # Elsewhere (SQLite) tags is a JSON list; probe it with json_each
+            stmt += lambda s: s.where(
+                exists().where(
+                    func.json_each(AgendaItem.tags).table_valued("value").c.value == tag
+                )
+            )
+        stmt += lambda s: s.order_by(AgendaItem.updated_at.desc()).limit(limit)
+        return stmt
 
     async def mark_completed(self, item_id: str) -> AgendaItem | None:
-        """Mark an agenda item as completed."""
-        item = await self.get_by_id(item_id)
+        """Mark an agenda item as completed in one UPDATE ... RETURNING."""
+        result = await self.session.scalars(
+            update(AgendaItem)
+            .where(AgendaItem.id == item_id)
+            .values(status=ItemStatus.COMPLETED, completed_at=func.now())
+            .returning(AgendaItem),
+            execution_options={"populate_existing": True},
+        )
+        item = result.one_or_none()
         if item:
-            item.status = ItemStatus.COMPLETED
-            item.completed_at = datetime.utcnow()
-            await self.session.commit()
-            await self.session.refresh(item)
             logger.info("completed_agenda_item", item_id=item_id)
         return item
 
     async def delete(self, item_id: str) -> bool:
-        """Delete an agenda item."""
-        item = await self.get_by_id(item_id)
-        if item:
-            await self.session.delete(item)
-            await self.session.commit()
-            logger.info("deleted_agenda_item", item_id=item_id)
-            return True
-        return False
+        """Delete an agenda item in one DELETE ... RETURNING."""
+        result = await self.session.execute(
+            delete(AgendaItem).where(AgendaItem.id == item_id).returning(AgendaItem.id)
+        )
+        if result.scalar_one_or_none() is None:
+            return False
+        logger.info("deleted_agenda_item", item_id=item_id)
+        return True
@@ -1,23 +1,109 @@
 """Search and knowledge management service."""
 
+from collections.abc import AsyncIterable, Callable
 from datetime import datetime
+from enum import Enum
+from functools import lru_cache
 from typing import Any
 
-from sqlalchemy import and_, or_, select
-
-from kiroween.agenda.models import AgendaItem, FAQAnswer, ItemStatus, ItemType
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    String,
+    UnaryExpression,
+    and_,
+    bindparam,
+    exists,
+    func,
+    or_,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.orm import InstrumentedAttribute
+
+from kiroween.agenda.models import (
+    FAQ_SEARCH_TSV,
+    AgendaItem,
+    FAQAnswer,
+    ItemStatus,
+    ItemType,
+    to_item_status,
+    to_item_type,
+)
 from kiroween.agenda.repository import AgendaRepository
-from kiroween.agenda.service import AgendaService
+from kiroween.agenda.service import AgendaService, get_agenda_service
 from kiroween.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Default pg_trgm.similarity_threshold used by the % operator
+_PG_TRGM_DEFAULT_THRESHOLD = 0.3
+
+# Unbounded FAQ scans are streamed from a server-side cursor in batches of this size
+_FAQ_YIELD_PER = 200
+
+
+def _canned_search(item_type: ItemType, *conditions: Any, order_by: Any) -> Select[AgendaItem]:
+    """Build a search over one item type, limited by the bound ``limit``."""
+    return (
+        select(AgendaItem)
+        .where(AgendaItem.type == item_type, *conditions)
+        .order_by(order_by)
+        .limit(bindparam("limit"))
+    )
+
+
+def _text_match(*columns: Any) -> ColumnElement[bool]:
+    """Match the bound ``pattern`` against any of the given columns."""
+    pattern = bindparam("pattern", type_=String)
+    return or_(*(column.ilike(pattern) for column in columns))
+
+
+# Canned searches are built once; per-call values are bound at execution
+_DECISIONS_ABOUT = _canned_search(
+    ItemType.DECISION,
+    _text_match(AgendaItem.title, AgendaItem.description, AgendaItem.project),
+    order_by=AgendaItem.created_at.desc(),
+)
+_TASKS_WITH_TEXT = _canned_search(
+    ItemType.TASK,
+    _text_match(AgendaItem.title, AgendaItem.description),
+    order_by=AgendaItem.updated_at.desc(),
+)
+_OPEN_QUESTIONS = _canned_search(
+    ItemType.QUESTION,
+    AgendaItem.status == ItemStatus.OPEN,
+    AgendaItem.created_at >= bindparam("cutoff"),
+    order_by=AgendaItem.created_at.desc(),
+)
+
+
+# structured_search filter keys, applied in this fixed order so equal filter
+# sets always produce the same SQL
+_ENUM_FILTERS: dict[str, tuple[InstrumentedAttribute[Any], Callable[[str], Enum]]] = {
+    "type": (AgendaItem.type, to_item_type),
+    "status": (AgendaItem.status, to_item_status),
+}
+_EQUALITY_FILTERS: dict[str, InstrumentedAttribute[str | None]] = {
+    "assigned_to": AgendaItem.assigned_to_user_id,
+    "requestor": AgendaItem.requestor_user_id,
+    "project": AgendaItem.project,
+    "channel_id": AgendaItem.source_channel_id,
+}
+_DEFAULT_ORDER_BY = AgendaItem.updated_at.desc()
+_ORDER_BY: dict[str, UnaryExpression[Any]] = {
+    "updated_at_desc": _DEFAULT_ORDER_BY,
+    "created_at_desc": AgendaItem.created_at.desc(),
+    "due_date_asc": AgendaItem.due_date.asc().nulls_last(),
+}
+
 
 class SearchService:
     """Service for structured search over agenda items."""
 
-    def __init__(self):
-        self.agenda_service = AgendaService()
+    def __init__(self, agenda_service: AgendaService | None = None):
+        self.agenda_service = agenda_service or get_agenda_service()
 
     async def search_decisions_about(
         self,
@@ -26,24 +112,11 @@ class SearchService:
         limit: int = 20,
     ) -> list[AgendaItem]:
         """Search for decisions about a specific topic."""
-        async with self.agenda_service.get_repository() as repo:
-            stmt = select(AgendaItem).where(
-                and_(
-                    AgendaItem.type == ItemType.DECISION,
-                    or_(
-                        AgendaItem.title.ilike(f"%{topic}%"),
-                        AgendaItem.description.ilike(f"%{topic}%"),
-                        AgendaItem.project.ilike(f"%{topic}%"),
-                    ),
-                )
-            )
-
-            if workspace_id:
-                stmt = stmt.where(AgendaItem.workspace_id == workspace_id)
-
-            stmt = stmt.order_by(AgendaItem.created_at.desc()).limit(limit)
-            result = await repo.session.execute(stmt)
-            return list(result.scalars().all())
+        return await self._typed_search(
+            _DECISIONS_ABOUT,
+            {"pattern": f"%{topic}%", "limit": limit},
+            [(AgendaItem.workspace_id, workspace_id)],
+        )
 
     async def search_tasks_with_text(
         self,
@@ -53,27 +126,14 @@ class SearchService:
         limit: int = 20,
     ) -> list[AgendaItem]:
         """Search tasks assigned to a user containing specific text."""
-        async with self.agenda_service.get_repository() as repo:
-            stmt = select(AgendaItem).where(
-                and_(
-                    AgendaItem.type == ItemType.TASK,
-                    or_(
-                        AgendaItem.title.ilike(f"%{text}%"),
-                        AgendaItem.description.ilike(f"%{text}%"),
-                        AgendaItem.raw_snippet.ilike(f"%{text}%"),
-                    ),
-                )
-            )
-
-            if assigned_to:
-                stmt = stmt.where(AgendaItem.assigned_to_user_id == assigned_to)
-
-            if workspace_id:
-                stmt = stmt.where(AgendaItem.workspace_id == workspace_id)
-
-            stmt = stmt.order_by(AgendaItem.updated_at.desc()).limit(limit)
-            result = await repo.session.execute(stmt)
-            return list(result.scalars().all())
+        return await self._typed_search(
+            _TASKS_WITH_TEXT,
+            {"pattern": f"%{text}%", "limit": limit},
+            [
+                (AgendaItem.assigned_to_user_id, assigned_to),
+                (AgendaItem.workspace_id, workspace_id),
+            ],
+        )
 
     async def search_open_questions(
         self,
@@ -87,24 +147,29 @@ class SearchService:
 
         cutoff_date = datetime.utcnow() - timedelta(days=days)
 
-        async with self.agenda_service.get_repository() as repo:
-            stmt = select(AgendaItem).where(
-                and_(
-                    AgendaItem.type == ItemType.QUESTION,
-                    AgendaItem.status == ItemStatus.OPEN,
-                    AgendaItem.created_at >= cutoff_date,
-                )
-            )
-
-            if asked_by:
-                stmt = stmt.where(AgendaItem.created_by_user_id == asked_by)
+        return await self._typed_search(
+            _OPEN_QUESTIONS,
+            {"cutoff": cutoff_date, "limit": limit},
+            [
+                (AgendaItem.created_by_user_id, asked_by),
+                (AgendaItem.workspace_id, workspace_id),
+            ],
+        )
 
-            if workspace_id:
-                stmt = stmt.where(AgendaItem.workspace_id == workspace_id)
+    async def _typed_search(
+        self,
+        stmt: Select[AgendaItem],
+        params: dict[str, Any],
+        filters: list[tuple[Any, str | None]],
+    ) -> list[AgendaItem]:
+        """Run a prebuilt search, adding an equality filter per non-empty value."""
+        for column, value in filters:
+            if value:
+                stmt = stmt.where(column == value)
 
-            stmt = stmt.order_by(AgendaItem.created_at.desc()).limit(limit)
-            result = await repo.session.execute(stmt)
-            return list(result.scalars().all())
+        async with self.agenda_service.get_repository() as repo:
+            result = await repo.session.scalars(stmt, params)
+            return list(result.all())
 
     async def structured_search(
         self,
@@ -116,35 +181,19 @@ class SearchService:
         async with self.agenda_service.get_repository() as repo:
             stmt = select(AgendaItem)
 
-            conditions = []
-
-            # Type filter
-            if item_type := filters.get("type"):
-                if isinstance(item_type, list):
-                    types = [ItemType(t) for t in item_type]
-                    conditions.append(AgendaItem.type.in_(types))
-                else:
-                    conditions.append(AgendaItem.type == ItemType(item_type))
-
-            # Status filter
-            if status := filters.get("status"):
-                if isinstance(status, list):
-                    statuses = [ItemStatus(s) for s in status]
-                    conditions.append(AgendaItem.status.in_(statuses))
-                else:
-                    conditions.append(AgendaItem.status == ItemStatus(status))
+            conditions: list[ColumnElement[bool]] = []
 
-            # Assignee filter
-            if assigned_to := filters.get("assigned_to"):
-                conditions.append(AgendaItem.assigned_to_user_id == assigned_to)
+            # Type/status filters accept a single value or a list
+            for key, (enum_column, coerce) in _ENUM_FILTERS.items():
+                if value := filters.get(key):
+                    if isinstance(value, list):
+                        conditions.append(enum_column.in_([coerce(v) for v in value]))
+                    else:
+                        conditions.append(enum_column == coerce(value))
 
-            # Requestor filter
-            if requestor := filters.get("requestor"):
-                conditions.append(AgendaItem.requestor_user_id == requestor)
-
-            # Project filter
-            if project := filters.get("project"):
-                conditions.append(AgendaItem.project == project)
+            for key, column in _EQUALITY_FILTERS.items():
+                if value := filters.get(key):
+                    conditions.append(column == value)
 
             # Text search
             if query := filters.get("query"):
@@ -152,7 +201,6 @@ class SearchService:
                     or_(
                         AgendaItem.title.ilike(f"%{query}%"),
                         AgendaItem.description.ilike(f"%{query}%"),
-                        AgendaItem.raw_snippet.ilike(f"%{query}%"),
                     )
                 )
 
@@ -167,26 +215,15 @@ class SearchService:
                     date_to = datetime.fromisoformat(date_to)
                 conditions.append(AgendaItem.created_at <= date_to)
 
-            # Channel filter
-            if channel_id := filters.get("channel_id"):
-                conditions.append(AgendaItem.source_channel_id == channel_id)
-
             if workspace_id:
                 conditions.append(AgendaItem.workspace_id == workspace_id)
 
             if conditions:
                 stmt = stmt.where(and_(*conditions))
 
-            # Ordering
-            order_by = filters.get("order_by", "updated_at_desc")
-            if order_by == "created_at_desc":
-                stmt = stmt.order_by(AgendaItem.created_at.desc())
-            elif order_by == "due_date_asc":
-                stmt = stmt.order_by(AgendaItem.due_date.asc().nulls_last())
-            else:
-                stmt = stmt.order_by(AgendaItem.updated_at.desc())
-
-            stmt = stmt.limit(limit)
+            # Ordering (unknown values fall back to most recently updated)
+            order_by = _ORDER_BY.get(filters.get("order_by") or "", _DEFAULT_ORDER_BY)
+            stmt = stmt.order_by(order_by).limit(limit)
             result = await repo.session.execute(stmt)
             return list(result.scalars().all())
 
@@ -194,8 +231,8 @@ class SearchService:
 class KnowledgeService:
     """Service for FAQ and canonical answer management."""
 
-    def __init__(self):
-        self.agenda_service = AgendaService()
+    def __init__(self, agenda_service: AgendaService | None = None):
+        self.agenda_service = agenda_service or get_agenda_service()
 
     async def create_faq_answer(
         self,
@@ -217,11 +254,11 @@ class KnowledgeService:
                 source_thread_ts=source_thread_ts,
                 source_channel_id=source_channel_id,
                 source_message_ts=source_message_ts,
-                tags=",".join(tags) if tags else None,
+                tags=tags or None,
                 is_canonical=is_canonical,
             )
             repo.session.add(faq)
-            await repo.session.commit()
+            await repo.session.flush()
             await repo.session.refresh(faq)
 
             logger.info("created_faq_answer", faq_id=faq.id, question=question[:50])
@@ -232,23 +269,46 @@ class KnowledgeService:
         query: str,
         workspace_id: str | None = None,
         limit: int = 10,
+        tag: str | None = None,
     ) -> list[FAQAnswer]:
-        """Search FAQ answers by question or answer text."""
+        """Search FAQ answers by question or answer text, optionally by tag.
+
+        On PostgreSQL this is a full-text match served by the GIN index on
+        ``FAQ_SEARCH_TSV``, ranked by ts_rank within canonical/non-canonical;
+        other databases fall back to ILIKE substring matching.
+        """
         async with self.agenda_service.get_repository() as repo:
-            stmt = select(FAQAnswer).where(
-                or_(
-                    FAQAnswer.question.ilike(f"%{query}%"),
-                    FAQAnswer.answer.ilike(f"%{query}%"),
+            conn = await repo.session.connection()
+            if conn.dialect.name == "postgresql":
+                tsquery = func.plainto_tsquery(text("'english'"), query)
+                stmt = select(FAQAnswer).where(FAQ_SEARCH_TSV.op("@@")(tsquery))
+                rank = func.ts_rank(FAQ_SEARCH_TSV, tsquery)
+            else:
+                stmt = select(FAQAnswer).where(
+                    or_(
+                        FAQAnswer.question.ilike(f"%{query}%"),
+                        FAQAnswer.answer.ilike(f"%{query}%"),
+                    )
                 )
-            )
+                rank = None
 
             if workspace_id:
                 stmt = stmt.where(FAQAnswer.workspace_id == workspace_id)
+            if tag and conn.dialect.name == "postgresql":
+                # tags @> ARRAY[tag], served by ix_faq_answers_tags_gin
+                stmt = stmt.where(FAQAnswer.tags.contains([tag]))
+            elif tag:
+                # Elsewhere (SQLite) tags is a JSON list; probe it with json_each
+                stmt = stmt.where(
+                    exists().where(
+                        func.json_each(FAQAnswer.tags).table_valued("value").c.value == tag
+                    )
+                )
 
-            stmt = stmt.order_by(
-                FAQAnswer.is_canonical.desc(),
-                FAQAnswer.usage_count.desc(),
-            ).limit(limit)
+            stmt = stmt.order_by(FAQAnswer.is_canonical.desc())
+            if rank is not None:
+                stmt = stmt.order_by(rank.desc())
+            stmt = stmt.order_by(FAQAnswer.usage_count.desc()).limit(limit)
 
             result = await repo.session.execute(stmt)
             return list(result.scalars().all())
@@ -259,41 +319,42 @@ class KnowledgeService:
         workspace_id: str | None = None,
         threshold: float = 0.7,
     ) -> FAQAnswer | None:
-        """Find if a similar question has been answered before."""
-        # Simple keyword-based similarity (could be enhanced with embeddings)
-        question_lower = question.lower()
-        question_words = set(question_lower.split())
+        """Find if a similar question has been answered before.
 
+        On PostgreSQL the best match is picked in SQL by pg_trgm similarity,
+        using the trigram index on question; other databases fall back to
+        word-level Jaccard similarity over the workspace's FAQs.
+        """
         async with self.agenda_service.get_repository() as repo:
-            stmt = select(FAQAnswer)
-            if workspace_id:
-                stmt = stmt.where(FAQAnswer.workspace_id == workspace_id)
-
-            result = await repo.session.execute(stmt)
-            all_faqs = list(result.scalars().all())
-
-            best_match = None
-            best_score = 0.0
-
-            for faq in all_faqs:
-                faq_question_lower = faq.question.lower()
-                faq_words = set(faq_question_lower.split())
-
-                # Simple Jaccard similarity
-                intersection = question_words & faq_words
-                union = question_words | faq_words
-                if union:
-                    similarity = len(intersection) / len(union)
-                    if similarity > best_score and similarity >= threshold:
-                        best_score = similarity
-                        best_match = faq
+            conn = await repo.session.connection()
+            if conn.dialect.name == "postgresql":
+                similarity = func.similarity(FAQAnswer.question, question)
+                stmt = select(FAQAnswer).where(similarity >= threshold)
+                if threshold >= _PG_TRGM_DEFAULT_THRESHOLD:
+                    # % is index-assisted and matches at pg_trgm's own
+                    # threshold, so it only narrows the scan here
+                    stmt = stmt.where(FAQAnswer.question.op("%")(question))
+                if workspace_id:
+                    stmt = stmt.where(FAQAnswer.workspace_id == workspace_id)
+                stmt = stmt.order_by(similarity.desc()).limit(1)
+                best_match = (await repo.session.scalars(stmt)).first()
+            else:
+                stmt = select(FAQAnswer).execution_options(yield_per=_FAQ_YIELD_PER)
+                if workspace_id:
+                    stmt = stmt.where(FAQAnswer.workspace_id == workspace_id)
+                faqs = await repo.session.stream_scalars(stmt)
+                best_match = await _best_jaccard_match(question, faqs, threshold)
 
             if best_match:
-                # Increment usage count
-                best_match.usage_count += 1
-                best_match.updated_at = datetime.utcnow()
-                await repo.session.commit()
-                await repo.session.refresh(best_match)
+                # Increment usage count atomically on the server
+                result = await repo.session.scalars(
+                    update(FAQAnswer)
+                    .where(FAQAnswer.id == best_match.id)
+                    .values(usage_count=FAQAnswer.usage_count + 1, updated_at=func.now())
+                    .returning(FAQAnswer),
+                    execution_options={"populate_existing": True},
+                )
+                best_match = result.one()
 
             return best_match
 
@@ -303,19 +364,18 @@ class KnowledgeService:
     ) -> FAQAnswer | None:
         """Promote an FAQ answer to canonical."""
         async with self.agenda_service.get_repository() as repo:
-            result = await repo.session.execute(
-                select(FAQAnswer).where(FAQAnswer.id == faq_id)
+            result = await repo.session.scalars(
+                update(FAQAnswer)
+                .where(FAQAnswer.id == faq_id)
+                .values(is_canonical=True, updated_at=func.now())
+                .returning(FAQAnswer),
+                execution_options={"populate_existing": True},
             )
-            faq = result.scalar_one_or_none()
+            faq = result.one_or_none()
 
             if not faq:
                 return None
 
-            faq.is_canonical = True
-            faq.updated_at = datetime.utcnow()
-            await repo.session.commit()
-            await repo.session.refresh(faq)
-
             logger.info("promoted_to_canonical", faq_id=faq_id)
             return faq
 
@@ -328,11 +388,34 @@ class KnowledgeService:
             return result.scalar_one_or_none()
 
 
+async def _best_jaccard_match(
+    question: str,
+    faqs: AsyncIterable[FAQAnswer],
+    threshold: float,
+) -> FAQAnswer | None:
+    """Return the FAQ whose question has the highest word Jaccard similarity."""
+    question_words = set(question.lower().split())
+
+    best_match = None
+    best_score = 0.0
+    async for faq in faqs:
+        faq_words = set(faq.question.lower().split())
+        union = question_words | faq_words
+        if union:
+            similarity = len(question_words & faq_words) / len(union)
+            if similarity > best_score and similarity >= threshold:
+                best_score = similarity
+                best_match = faq
+    return best_match
+
+
+@lru_cache(maxsize=1)
 def get_search_service() -> SearchService:
     """Get the global search service instance."""
     return SearchService()
 
 
+@lru_cache(maxsize=1)
 def get_knowledge_service() -> KnowledgeService:
     """Get the global knowledge service instance."""
     return KnowledgeService()
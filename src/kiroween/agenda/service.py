@@ -1,12 +1,18 @@
 """Business logic for agenda operations."""
 
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from kiroween.agenda.models import AgendaItem, ItemStatus, ItemType
-from kiroween.agenda.repository import AgendaRepository, get_async_session_factory
+from kiroween.agenda.models import AgendaItem, to_item_status, to_item_type
+from kiroween.agenda.repository import (
+    AgendaItemSummary,
+    AgendaRepository,
+    get_async_session_factory,
+)
 from kiroween.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -20,10 +26,29 @@ class AgendaService:
 
     @asynccontextmanager
     async def get_repository(self) -> AsyncGenerator[AgendaRepository, None]:
-        """Get a repository instance with managed session."""
-        async with self._session_factory() as session:
+        """Get a repository whose session runs as one unit of work.
+
+        The transaction commits once when the block exits, or rolls back if
+        it raises, so several repository calls cost a single commit.
+        """
+        async with self._session_factory.begin() as session:
             yield AgendaRepository(session)
 
+    @asynccontextmanager
+    async def use_repository(
+        self, repo: AgendaRepository | None = None
+    ) -> AsyncGenerator[AgendaRepository, None]:
+        """Yield ``repo`` if given, otherwise a new managed repository.
+
+        Lets a caller run several service operations on one session instead
+        of checking out a connection for each.
+        """
+        if repo is not None:
+            yield repo
+            return
+        async with self.get_repository() as new_repo:
+            yield new_repo
+
     async def upsert_item(
         self,
         item_type: str,
@@ -39,6 +64,15 @@ class AgendaService:
         source_url: str | None = None,
         priority: int = 0,
         tags: list[str] | None = None,
+        workspace_id: str | None = None,
+        raw_snippet: str | None = None,
+        source_message_ts: str | None = None,
+        requestor_user_id: str | None = None,
+        requestor_user_name: str | None = None,
+        created_by_user_id: str | None = None,
+        project: str | None = None,
+        topic: str | None = None,
+        due_date: datetime | None = None,
     ) -> AgendaItem:
         """Create or update an agenda item.
 
@@ -56,15 +90,24 @@ class AgendaService:
             source_url: Link to the source message
             priority: Priority level (0=normal, 1=high, 2=urgent)
             tags: List of tags
+            workspace_id: Workspace ID
+            raw_snippet: Excerpt of the source message
+            source_message_ts: Source message timestamp
+            requestor_user_id: Slack user ID of the requestor
+            requestor_user_name: Display name of the requestor
+            created_by_user_id: Slack user ID of the creator
+            project: Project name
+            topic: Topic
+            due_date: Due date (due_at is generated from it)
 
         Returns:
             The created or updated AgendaItem.
         """
-        item_data = {
-            "type": ItemType(item_type),
+        item_data: dict[str, Any] = {
+            "type": to_item_type(item_type),
             "title": title,
             "description": description,
-            "status": ItemStatus(status),
+            "status": to_item_status(status),
             "assigned_to_user_id": assigned_to_user_id,
             "assigned_to_user_name": assigned_to_user_name,
             "source_channel_id": source_channel_id,
@@ -72,9 +115,25 @@ class AgendaService:
             "source_thread_ts": source_thread_ts,
             "source_url": source_url,
             "priority": priority,
-            "tags": ",".join(tags) if tags else None,
+            "tags": tags or None,
         }
 
+        # Optional fields are only written when given, so updates keep them
+        optional_fields = {
+            "workspace_id": workspace_id,
+            "raw_snippet": raw_snippet,
+            "source_message_ts": source_message_ts,
+            "requestor_user_id": requestor_user_id,
+            "requestor_user_name": requestor_user_name,
+            "created_by_user_id": created_by_user_id,
+            "project": project,
+            "topic": topic,
+            "due_date": due_date,
+        }
+        item_data.update(
+            {key: value for key, value in optional_fields.items() if value is not None}
+        )
+
         if item_id:
             item_data["id"] = item_id
 
@@ -89,6 +148,7 @@ class AgendaService:
         assigned_to: str | None = None,
         channel_id: str | None = None,
         limit: int = 50,
+        tag: str | None = None,
     ) -> list[AgendaItem]:
         """Search agenda items with filters.
 
@@ -99,6 +159,7 @@ class AgendaService:
             assigned_to: Filter by assigned user ID
             channel_id: Filter by source channel
             limit: Maximum number of results
+            tag: Filter by tag
 
         Returns:
             List of matching AgendaItems.
@@ -106,17 +167,40 @@ class AgendaService:
         async with self.get_repository() as repo:
             return await repo.search(
                 query=query,
-                item_type=ItemType(item_type) if item_type else None,
-                status=ItemStatus(status) if status else None,
+                item_type=to_item_type(item_type) if item_type else None,
+                status=to_item_status(status) if status else None,
+                assigned_to=assigned_to,
+                channel_id=channel_id,
+                limit=limit,
+                tag=tag,
+            )
+
+    async def search_item_summaries(
+        self,
+        query: str | None = None,
+        item_type: str | None = None,
+        status: str | None = None,
+        assigned_to: str | None = None,
+        channel_id: str | None = None,
+        limit: int = 50,
+        tag: str | None = None,
+    ) -> list[AgendaItemSummary]:
+        """Search agenda items, returned as lightweight summaries for list output."""
+        async with self.get_repository() as repo:
+            return await repo.search_summaries(
+                query=query,
+                item_type=to_item_type(item_type) if item_type else None,
+                status=to_item_status(status) if status else None,
                 assigned_to=assigned_to,
                 channel_id=channel_id,
                 limit=limit,
+                tag=tag,
             )
 
-    async def get_item(self, item_id: str) -> AgendaItem | None:
-        """Get a specific agenda item by ID."""
+    async def get_item(self, item_id: str, with_history: bool = False) -> AgendaItem | None:
+        """Get a specific agenda item by ID, optionally with its change history."""
         async with self.get_repository() as repo:
-            return await repo.get_by_id(item_id)
+            return await repo.get_by_id(item_id, with_history=with_history)
 
     async def complete_item(self, item_id: str) -> AgendaItem | None:
         """Mark an agenda item as completed."""
@@ -129,13 +213,7 @@ class AgendaService:
             return await repo.delete(item_id)
 
 
-# Global service instance
-_agenda_service: AgendaService | None = None
-
-
+@lru_cache(maxsize=1)
 def get_agenda_service() -> AgendaService:
     """Get the global agenda service instance."""
-    global _agenda_service
-    if _agenda_service is None:
-        _agenda_service = AgendaService()
-    return _agenda_service
+    return AgendaService()
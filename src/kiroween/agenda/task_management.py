@@ -1,22 +1,39 @@
 """Task and workflow management service."""
 
+from collections.abc import Sequence
 from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, cast
 
-from sqlalchemy import and_, or_, select
+from sqlalchemy import CursorResult, bindparam, func, select, update
 
-from kiroween.agenda.models import AgendaItem, ItemStatus, ItemType
+from kiroween.agenda.ingestion import get_ingestion_service
+from kiroween.agenda.models import AgendaItem, ItemStatus, ItemType, to_item_status
 from kiroween.agenda.repository import AgendaRepository
-from kiroween.agenda.service import AgendaService
+from kiroween.agenda.service import AgendaService, get_agenda_service
 from kiroween.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Open-task listings, built once; per-call values are bound at execution
+_OPEN_TASKS = select(AgendaItem).where(
+    AgendaItem.type == ItemType.TASK,
+    AgendaItem.status.in_([ItemStatus.OPEN, ItemStatus.IN_PROGRESS]),
+)
+_OVERDUE_TASKS = _OPEN_TASKS.where(
+    AgendaItem.due_date.isnot(None),
+    AgendaItem.due_date < bindparam("now"),
+).order_by(AgendaItem.due_date.asc())
+_TASKS_WITHOUT_OWNER = _OPEN_TASKS.where(AgendaItem.assigned_to_user_id.is_(None))
+_TASKS_WITHOUT_DUE_DATE = _OPEN_TASKS.where(AgendaItem.due_date.is_(None))
+
 
 class TaskManagementService:
     """Service for managing task lifecycle and workflows."""
 
-    def __init__(self):
-        self.agenda_service = AgendaService()
+    def __init__(self, agenda_service: AgendaService | None = None):
+        self.agenda_service = agenda_service or get_agenda_service()
+        self.ingestion = get_ingestion_service()
 
     async def create_task_from_message(
         self,
@@ -30,10 +47,7 @@ class TaskManagementService:
         priority: int = 0,
     ) -> AgendaItem:
         """Create a task from a message."""
-        from kiroween.agenda.ingestion import MessageIngestionService
-
-        ingestion = MessageIngestionService()
-        title = ingestion.extract_title(message_text)
+        title = self.ingestion.extract_title(message_text)
 
         item = await self.agenda_service.upsert_item(
             item_type=ItemType.TASK.value,
@@ -45,16 +59,10 @@ class TaskManagementService:
             source_channel_id=source_channel_id,
             source_thread_ts=source_thread_ts,
             priority=priority,
+            requestor_user_id=requestor_user_id,
+            due_date=due_date,
         )
 
-        # Update with additional fields
-        async with self.agenda_service.get_repository() as repo:
-            item.requestor_user_id = requestor_user_id
-            item.due_date = due_date
-            item.due_at = due_date
-            await repo.session.commit()
-            await repo.session.refresh(item)
-
         logger.info("created_task", item_id=item.id, assignee=assignee_user_id)
         return item
 
@@ -63,23 +71,24 @@ class TaskManagementService:
         task_id: str,
         status: str,
         changed_by: str | None = None,
+        *,
+        repo: AgendaRepository | None = None,
     ) -> AgendaItem | None:
         """Update task status with history tracking."""
-        async with self.agenda_service.get_repository() as repo:
-            item = await repo.get_by_id(task_id)
+        async with self.agenda_service.use_repository(repo) as repo:
+            item = await repo.session.get(AgendaItem, task_id)
             if not item:
                 return None
 
             old_status = item.status.value
-            item.status = ItemStatus(status)
+            item.status = to_item_status(status)
 
             if status == ItemStatus.COMPLETED.value:
                 item.completed_at = datetime.utcnow()
             elif status == ItemStatus.IN_PROGRESS.value and not item.completed_at:
                 item.completed_at = None
 
-            await repo.session.commit()
-            await repo.session.refresh(item)
+            await repo.session.flush()
 
             logger.info(
                 "updated_task_status",
@@ -94,29 +103,34 @@ class TaskManagementService:
         self,
         thread_ts: str,
         channel_id: str | None = None,
+        *,
+        repo: AgendaRepository | None = None,
     ) -> int:
-        """Close all open tasks in a thread."""
-        async with self.agenda_service.get_repository() as repo:
-            stmt = select(AgendaItem).where(
-                and_(
+        """Close all open tasks in a thread with one bulk UPDATE.
+
+        A caller's ``repo`` may already hold some of these tasks, so its
+        identity map is synchronized from the updated rows; a fresh
+        session holds nothing and skips that work.
+        """
+        synchronize_session = "fetch" if repo is not None else False
+        async with self.agenda_service.use_repository(repo) as repo:
+            stmt = (
+                update(AgendaItem)
+                .where(
                     AgendaItem.source_thread_ts == thread_ts,
                     AgendaItem.type == ItemType.TASK,
                     AgendaItem.status.in_([ItemStatus.OPEN, ItemStatus.IN_PROGRESS]),
                 )
+                .values(status=ItemStatus.COMPLETED, completed_at=func.now())
+                .execution_options(synchronize_session=synchronize_session)
             )
             if channel_id:
                 stmt = stmt.where(AgendaItem.source_channel_id == channel_id)
 
-            result = await repo.session.execute(stmt)
-            items = list(result.scalars().all())
-
-            count = 0
-            for item in items:
-                item.status = ItemStatus.COMPLETED
-                item.completed_at = datetime.utcnow()
-                count += 1
+            # DML results are cursor results, which carry the rowcount
+            result = cast(CursorResult[Any], await repo.session.execute(stmt))
+            count = result.rowcount
 
-            await repo.session.commit()
             logger.info("closed_tasks_in_thread", thread_ts=thread_ts, count=count)
             return count
 
@@ -124,106 +138,81 @@ class TaskManagementService:
         self,
         user_id: str | None = None,
         workspace_id: str | None = None,
-    ) -> list[AgendaItem]:
+    ) -> Sequence[AgendaItem]:
         """Get all overdue tasks."""
         now = datetime.utcnow()
         async with self.agenda_service.get_repository() as repo:
-            stmt = select(AgendaItem).where(
-                and_(
-                    AgendaItem.type == ItemType.TASK,
-                    AgendaItem.status.in_([ItemStatus.OPEN, ItemStatus.IN_PROGRESS]),
-                    AgendaItem.due_date.isnot(None),
-                    AgendaItem.due_date < now,
-                )
-            )
-
+            stmt = _OVERDUE_TASKS
             if user_id:
                 stmt = stmt.where(AgendaItem.assigned_to_user_id == user_id)
             if workspace_id:
                 stmt = stmt.where(AgendaItem.workspace_id == workspace_id)
 
-            stmt = stmt.order_by(AgendaItem.due_date.asc())
-            result = await repo.session.execute(stmt)
-            return list(result.scalars().all())
+            result = await repo.session.scalars(stmt, {"now": now})
+            return result.all()
 
     async def get_tasks_without_owner(
         self,
         workspace_id: str | None = None,
-    ) -> list[AgendaItem]:
+    ) -> Sequence[AgendaItem]:
         """Get tasks with no assignee."""
         async with self.agenda_service.get_repository() as repo:
-            stmt = select(AgendaItem).where(
-                and_(
-                    AgendaItem.type == ItemType.TASK,
-                    AgendaItem.status.in_([ItemStatus.OPEN, ItemStatus.IN_PROGRESS]),
-                    or_(
-                        AgendaItem.assigned_to_user_id.is_(None),
-                        AgendaItem.assigned_to_user_id == "",
-                    ),
-                )
-            )
-
+            stmt = _TASKS_WITHOUT_OWNER
             if workspace_id:
                 stmt = stmt.where(AgendaItem.workspace_id == workspace_id)
 
             result = await repo.session.execute(stmt)
-            return list(result.scalars().all())
+            return result.scalars().all()
 
     async def get_tasks_without_due_date(
         self,
         user_id: str | None = None,
         workspace_id: str | None = None,
-    ) -> list[AgendaItem]:
+    ) -> Sequence[AgendaItem]:
         """Get tasks with no due date."""
         async with self.agenda_service.get_repository() as repo:
-            stmt = select(AgendaItem).where(
-                and_(
-                    AgendaItem.type == ItemType.TASK,
-                    AgendaItem.status.in_([ItemStatus.OPEN, ItemStatus.IN_PROGRESS]),
-                    AgendaItem.due_date.is_(None),
-                )
-            )
-
+            stmt = _TASKS_WITHOUT_DUE_DATE
             if user_id:
                 stmt = stmt.where(AgendaItem.assigned_to_user_id == user_id)
             if workspace_id:
                 stmt = stmt.where(AgendaItem.workspace_id == workspace_id)
 
             result = await repo.session.execute(stmt)
-            return list(result.scalars().all())
+            return result.scalars().all()
 
     async def mark_stale_tasks(
         self,
         days_inactive: int = 30,
         workspace_id: str | None = None,
     ) -> int:
-        """Mark tasks as stale if they haven't been updated in N days."""
+        """Mark tasks as stale if they haven't been updated in N days.
+
+        Runs as one bulk UPDATE; the rows are never loaded into the session.
+        """
         cutoff_date = datetime.utcnow() - timedelta(days=days_inactive)
         async with self.agenda_service.get_repository() as repo:
-            stmt = select(AgendaItem).where(
-                and_(
+            stmt = (
+                update(AgendaItem)
+                .where(
                     AgendaItem.type == ItemType.TASK,
                     AgendaItem.status.in_([ItemStatus.OPEN, ItemStatus.IN_PROGRESS]),
                     AgendaItem.updated_at < cutoff_date,
                 )
+                .values(status=ItemStatus.STALE)
+                .execution_options(synchronize_session=False)
             )
 
             if workspace_id:
                 stmt = stmt.where(AgendaItem.workspace_id == workspace_id)
 
-            result = await repo.session.execute(stmt)
-            items = list(result.scalars().all())
-
-            count = 0
-            for item in items:
-                item.status = ItemStatus.STALE
-                count += 1
+            result = cast(CursorResult[Any], await repo.session.execute(stmt))
+            count = result.rowcount
 
-            await repo.session.commit()
             logger.info("marked_stale_tasks", count=count, days_inactive=days_inactive)
             return count
 
 
+@lru_cache(maxsize=1)
 def get_task_management_service() -> TaskManagementService:
     """Get the global task management service instance."""
     return TaskManagementService()
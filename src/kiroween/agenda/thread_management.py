@@ -1,35 +1,48 @@
 """Thread and decision management service."""
 
 import re
-from datetime import datetime
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import Insert as PgInsert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import Insert as SqliteInsert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
+from kiroween.agenda.ingestion import _PROJECT_RE, extract_title
 from kiroween.agenda.models import AgendaItem, Decision, ItemStatus, ItemType, ThreadTitle
 from kiroween.agenda.repository import AgendaRepository
-from kiroween.agenda.service import AgendaService
+from kiroween.agenda.service import AgendaService, get_agenda_service
 from kiroween.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Decision detail patterns; title scrubbing is shared with ingestion
+_MENTION_ID_RE = re.compile(r"<@(\w+)>")
+
+# Dialect-specific INSERT constructs that support ON CONFLICT DO UPDATE
+_UPSERT_INSERT: dict[str, Callable[[type[ThreadTitle]], PgInsert | SqliteInsert]] = {
+    "postgresql": pg_insert,
+    "sqlite": sqlite_insert,
+}
+
 
 class ThreadManagementService:
     """Service for managing threads, titles, and decision extraction."""
 
-    def __init__(self):
-        self.agenda_service = AgendaService()
+    def __init__(self, agenda_service: AgendaService | None = None):
+        self.agenda_service = agenda_service or get_agenda_service()
 
-    # Decision extraction patterns
-    DECISION_PATTERNS = [
-        r"we'll go with\s+([^.!?]+)",
-        r"final decision:\s*([^.!?]+)",
-        r"consensus:\s*([^.!?]+)",
-        r"we decided\s+([^.!?]+)",
-        r"agreed to\s+([^.!?]+)",
-        r"decision:\s*([^.!?]+)",
-        r"decided:\s*([^.!?]+)",
-    ]
+    # Decision extraction: one alternation of the trigger phrases, so each
+    # message is scanned once. Longer phrases come first ("final decision:"
+    # before "decision:") so the most specific trigger wins.
+    DECISION_PATTERN = re.compile(
+        r"(?:we'll go with\s+|final decision:\s*|consensus:\s*|we decided\s+"
+        r"|agreed to\s+|decision:\s*|decided:\s*)([^.!?]+)",
+        re.IGNORECASE,
+    )
 
     async def infer_thread_title(
         self,
@@ -48,61 +61,40 @@ class ThreadManagementService:
 
             if use_llm:
                 # TODO: Use LLM to generate title
-                title = self._extract_title_from_text(first_text)
+                title = extract_title(first_text) or "Untitled Thread"
             else:
-                title = self._extract_title_from_text(first_text)
+                title = extract_title(first_text) or "Untitled Thread"
 
         async with self.agenda_service.get_repository() as repo:
-            # Check if title already exists
-            result = await repo.session.execute(
-                select(ThreadTitle).where(ThreadTitle.thread_ts == thread_ts)
-            )
-            existing = result.scalar_one_or_none()
-
-            if existing:
-                existing.title = title
-                existing.updated_at = datetime.utcnow()
-                existing.last_activity_at = datetime.utcnow()
-                existing.message_count = len(thread_messages)
-                await repo.session.commit()
-                await repo.session.refresh(existing)
-                return existing
-
-            thread_title = ThreadTitle(
+            # One atomic INSERT ... ON CONFLICT (thread_ts) DO UPDATE, so
+            # concurrent workers can't both insert the same thread
+            conn = await repo.session.connection()
+            stmt = _UPSERT_INSERT[conn.dialect.name](ThreadTitle).values(
                 workspace_id=workspace_id,
                 channel_id=channel_id,
                 thread_ts=thread_ts,
                 title=title,
                 inferred_by="first_message" if not use_llm else "llm",
-                last_activity_at=datetime.utcnow(),
+                last_activity_at=func.now(),
                 message_count=len(thread_messages),
             )
-            repo.session.add(thread_title)
-            await repo.session.commit()
-            await repo.session.refresh(thread_title)
+            upsert = stmt.on_conflict_do_update(
+                index_elements=[ThreadTitle.thread_ts],
+                set_={
+                    "title": stmt.excluded.title,
+                    "updated_at": func.now(),
+                    "last_activity_at": stmt.excluded.last_activity_at,
+                    "message_count": stmt.excluded.message_count,
+                },
+            ).returning(ThreadTitle)
+            result = await repo.session.scalars(
+                upsert, execution_options={"populate_existing": True}
+            )
+            thread_title = result.one()
 
             logger.info("inferred_thread_title", thread_ts=thread_ts, title=title)
             return thread_title
 
-    def _extract_title_from_text(self, text: str, max_length: int = 100) -> str:
-        """Extract a title from message text."""
-        # Remove markdown, mentions, URLs
-        text = re.sub(r"<@\w+>", "", text)
-        text = re.sub(r"<https?://[^>]+>", "", text)
-        text = re.sub(r"https?://\S+", "", text)
-        text = re.sub(r"[*_`]", "", text)
-
-        # Take first sentence or first line
-        lines = text.split("\n")
-        first_line = lines[0].strip()
-        sentences = re.split(r"[.!?]", first_line)
-        title = sentences[0].strip() if sentences else first_line
-
-        if len(title) > max_length:
-            title = title[:max_length - 3] + "..."
-
-        return title or "Untitled Thread"
-
     async def extract_decisions_from_thread(
         self,
         thread_messages: list[dict[str, Any]],
@@ -110,63 +102,70 @@ class ThreadManagementService:
         channel_id: str | None = None,
         thread_ts: str | None = None,
     ) -> list[Decision]:
-        """Extract decisions from a thread."""
+        """Extract decisions from a thread.
+
+        Every decision and its agenda item are written in one transaction
+        with a single flush, rather than one commit per match.
+        """
         decisions = []
 
         for message in thread_messages:
-            text = message.get("text", "").lower()
+            text = message.get("text", "")
             message_ts = message.get("ts")
 
-            for pattern in self.DECISION_PATTERNS:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    decision_text = match.group(1).strip()
-
-                    # Create decision record
-                    async with self.agenda_service.get_repository() as repo:
-                        decision = Decision(
-                            workspace_id=workspace_id,
-                            thread_ts=thread_ts,
-                            channel_id=channel_id,
-                            decision_message_ts=message_ts,
-                            decision_text=decision_text,
-                        )
-                        repo.session.add(decision)
-
-                        # Also create agenda item
-                        agenda_item = await self.agenda_service.upsert_item(
-                            item_type=ItemType.DECISION.value,
-                            title=f"Decision: {decision_text[:100]}",
-                            description=message.get("text", ""),
-                            status=ItemStatus.OPEN.value,
-                            source_channel_id=channel_id,
-                            source_thread_ts=thread_ts,
-                        )
-
-                        decision.agenda_item_id = agenda_item.id
-
-                        # Extract project if mentioned
-                        project_match = re.search(
-                            r"project[:\s]+(\w+)", message.get("text", ""), re.IGNORECASE
-                        )
-                        if project_match:
-                            agenda_item.project = project_match.group(1)
-                            decision.project = project_match.group(1)
-
-                        # Extract involved users
-                        mentions = re.findall(r"<@(\w+)>", message.get("text", ""))
-                        if mentions:
-                            decision.involved_user_ids = ",".join(mentions)
-
-                        await repo.session.commit()
-                        await repo.session.refresh(decision)
-
-                        decisions.append(decision)
-                        logger.info(
-                            "extracted_decision",
-                            decision_id=decision.id,
-                            thread_ts=thread_ts,
-                        )
+            # The pattern is case-insensitive, so the text is matched as-is
+            # and decisions keep their original capitalisation
+            matches = list(self.DECISION_PATTERN.finditer(text))
+            if not matches:
+                continue
+
+            # Project and involved users are per message, shared by its decisions
+            project_match = _PROJECT_RE.search(text)
+            project = project_match.group(1) if project_match else None
+            mentions = _MENTION_ID_RE.findall(text) or None
+
+            # At most one decision per trigger phrase in a message, so a
+            # repeated "decision:" only records its first occurrence
+            seen_triggers = set()
+            for match in matches:
+                trigger = text[match.start():match.start(1)].rstrip().lower()
+                if trigger in seen_triggers:
+                    continue
+                seen_triggers.add(trigger)
+                decision_text = match.group(1).strip()
+
+                # Decision record plus its agenda item, linked on flush
+                agenda_item = AgendaItem(
+                    type=ItemType.DECISION,
+                    title=f"Decision: {decision_text[:100]}",
+                    description=text,
+                    status=ItemStatus.OPEN,
+                    source_channel_id=channel_id,
+                    source_thread_ts=thread_ts,
+                    project=project,
+                )
+                decisions.append(Decision(
+                    workspace_id=workspace_id,
+                    thread_ts=thread_ts,
+                    channel_id=channel_id,
+                    decision_message_ts=message_ts,
+                    decision_text=decision_text,
+                    project=project,
+                    involved_user_ids=mentions,
+                    agenda_item=agenda_item,
+                ))
+
+        if decisions:
+            async with self.agenda_service.get_repository() as repo:
+                repo.session.add_all(decisions)
+                await repo.session.flush()
+
+            for decision in decisions:
+                logger.info(
+                    "extracted_decision",
+                    decision_id=decision.id,
+                    thread_ts=thread_ts,
+                )
 
         return decisions
 
@@ -185,37 +184,44 @@ class ThreadManagementService:
 
             stmt = stmt.order_by(ThreadTitle.last_activity_at.desc()).limit(limit)
             result = await repo.session.execute(stmt)
-            thread_titles = list(result.scalars().all())
-
-            # For each thread, get task/decision counts
-            dashboard = []
-            for thread_title in thread_titles:
-                # Count tasks in thread
-                tasks_stmt = select(func.count(AgendaItem.id)).where(
-                    and_(
-                        AgendaItem.source_thread_ts == thread_title.thread_ts,
+            thread_titles = result.scalars().all()
+
+            # Open task and decision counts for all threads, one GROUP BY each
+            thread_ts_list = [thread_title.thread_ts for thread_title in thread_titles]
+            # Keyed by the nullable thread_ts columns; IN (...) never matches NULL
+            task_counts: dict[str | None, int] = {}
+            decision_counts: dict[str | None, int] = {}
+            if thread_ts_list:
+                tasks_stmt = (
+                    select(AgendaItem.source_thread_ts, func.count(AgendaItem.id))
+                    .where(
+                        AgendaItem.source_thread_ts.in_(thread_ts_list),
                         AgendaItem.type == ItemType.TASK,
                         AgendaItem.status.in_([ItemStatus.OPEN, ItemStatus.IN_PROGRESS]),
                     )
+                    .group_by(AgendaItem.source_thread_ts)
                 )
-                tasks_result = await repo.session.execute(tasks_stmt)
-                task_count = tasks_result.scalar_one()
+                task_counts = dict((await repo.session.execute(tasks_stmt)).tuples().all())
 
-                # Count decisions in thread
-                decisions_stmt = select(func.count(Decision.id)).where(
-                    Decision.thread_ts == thread_title.thread_ts
+                decisions_stmt = (
+                    select(Decision.thread_ts, func.count(Decision.id))
+                    .where(Decision.thread_ts.in_(thread_ts_list))
+                    .group_by(Decision.thread_ts)
+                )
+                decision_counts = dict(
+                    (await repo.session.execute(decisions_stmt)).tuples().all()
                 )
-                decisions_result = await repo.session.execute(decisions_stmt)
-                decision_count = decisions_result.scalar_one()
 
+            dashboard = []
+            for thread_title in thread_titles:
                 dashboard.append({
                     "thread_ts": thread_title.thread_ts,
                     "title": thread_title.title,
                     "channel_id": thread_title.channel_id,
                     "last_activity_at": thread_title.last_activity_at.isoformat() if thread_title.last_activity_at else None,
                     "message_count": thread_title.message_count,
-                    "task_count": task_count,
-                    "decision_count": decision_count,
+                    "task_count": task_counts.get(thread_title.thread_ts, 0),
+                    "decision_count": decision_counts.get(thread_title.thread_ts, 0),
                     "is_resolved": thread_title.is_resolved,
                 })
 
@@ -225,9 +231,11 @@ class ThreadManagementService:
         self,
         thread_ts: str,
         workspace_id: str | None = None,
+        *,
+        repo: AgendaRepository | None = None,
     ) -> bool:
         """Mark a thread as resolved."""
-        async with self.agenda_service.get_repository() as repo:
+        async with self.agenda_service.use_repository(repo) as repo:
             stmt = select(ThreadTitle).where(ThreadTitle.thread_ts == thread_ts)
             if workspace_id:
                 stmt = stmt.where(ThreadTitle.workspace_id == workspace_id)
@@ -239,8 +247,6 @@ class ThreadManagementService:
                 return False
 
             thread_title.is_resolved = True
-            thread_title.updated_at = datetime.utcnow()
-            await repo.session.commit()
 
             logger.info("marked_thread_resolved", thread_ts=thread_ts)
             return True
@@ -248,15 +254,18 @@ class ThreadManagementService:
     async def get_thread_title(
         self,
         thread_ts: str,
+        *,
+        repo: AgendaRepository | None = None,
     ) -> ThreadTitle | None:
         """Get thread title by thread_ts."""
-        async with self.agenda_service.get_repository() as repo:
+        async with self.agenda_service.use_repository(repo) as repo:
             result = await repo.session.execute(
                 select(ThreadTitle).where(ThreadTitle.thread_ts == thread_ts)
             )
             return result.scalar_one_or_none()
 
 
+@lru_cache(maxsize=1)
 def get_thread_management_service() -> ThreadManagementService:
     """Get the global thread management service instance."""
     return ThreadManagementService()
@@ -1,27 +1,101 @@
 """LangChain tools for agenda operations."""
 
-from datetime import datetime
+from collections.abc import Awaitable, Callable, Hashable
+from datetime import UTC, datetime
 from typing import Any
 
 from langchain_core.tools import tool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from kiroween.agenda.notifications import get_digest_service
 from kiroween.agenda.ingestion import get_ingestion_service
+from kiroween.agenda.models import AgendaItem
+from kiroween.agenda.repository import AgendaItemSummary
 from kiroween.agenda.search import get_knowledge_service, get_search_service
 from kiroween.agenda.service import get_agenda_service
 from kiroween.agenda.task_management import get_task_management_service
 from kiroween.agenda.thread_management import get_thread_management_service
 from kiroween.agenda.views import get_views_service
 from kiroween.agenda.workflows import get_personal_workflows_service
+from kiroween.utils.cache import TTLCache
 from kiroween.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# The agent often repeats a read tool call with identical arguments within a
+# session, so the formatted results of read-only tools are cached briefly.
+# Agenda writes made through these tools clear the agenda read caches.
+# FAQ lookups are not cached: each one records usage on the matched answer.
+_SEARCH_RESULTS = TTLCache(ttl=60)
+_MY_TASKS_RESULTS = TTLCache(ttl=30)
+_OVERDUE_RESULTS = TTLCache(ttl=30)
+_DECISION_RESULTS = TTLCache(ttl=60)
+_AGENDA_READ_CACHES = (_SEARCH_RESULTS, _MY_TASKS_RESULTS, _OVERDUE_RESULTS, _DECISION_RESULTS)
+
+# Result formatting lookups; unknown statuses and priorities get the defaults
+_STATUS_EMOJI = {
+    "open": "📋",
+    "in_progress": "🔄",
+    "completed": "✅",
+    "deferred": "⏸️",
+    "cancelled": "❌",
+}
+_PRIORITY_NAMES = {1: "high", 2: "urgent"}
+_PRIORITY_BADGES = {1: " 🟡 HIGH", 2: " 🔴 URGENT"}
+_PRIORITY_MARKS = {1: " 🟡", 2: " 🔴"}
+
+
+def _invalidate_agenda_reads() -> None:
+    """Forget cached agenda read results after a write."""
+    for cache in _AGENDA_READ_CACHES:
+        cache.clear()
+
+
+async def _cached(cache: TTLCache, key: Hashable, render: Callable[[], Awaitable[str]]) -> str:
+    """Return the cached result for ``key``, rendering and storing it on a miss.
+
+    Exceptions from ``render`` propagate, so error replies are never cached.
+    """
+    result: str | None = cache.get(key)
+    if result is None:
+        result = await render()
+        cache.set(key, result)
+    return result
+
+
+# Tool arguments are validated once per call and never mutated; extra keys
+# the model invents are dropped rather than rejected
+_TOOL_ARGS_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
+
+def _format_search_item(item: AgendaItemSummary) -> str:
+    """Format one agenda_db_search result."""
+    status_emoji = _STATUS_EMOJI.get(item.status.value, "📋")
+    priority_str = _PRIORITY_BADGES.get(item.priority, "")
+    assignee = f" → {item.assigned_to_user_name}" if item.assigned_to_user_name else ""
+    return (
+        f"{status_emoji} [{item.type.value.upper()}] {item.title}{priority_str}{assignee}\n"
+        f"   ID: {item.id} | Status: {item.status.value}"
+    )
+
+
+def _format_my_task(task: AgendaItem) -> str:
+    """Format one get_my_tasks line."""
+    due_str = f" (Due: {task.due_date.strftime('%Y-%m-%d')})" if task.due_date else ""
+    return f"• {task.title}{_PRIORITY_MARKS.get(task.priority, '')}{due_str}"
+
+
+def _format_overdue_task(task: AgendaItem, now: datetime) -> str:
+    """Format one get_overdue_tasks line; ``now`` is naive UTC like due_date."""
+    days_overdue = (now - task.due_date).days if task.due_date else 0
+    return f"• {task.title} ({days_overdue} days overdue)"
+
 
 class AgendaUpsertInput(BaseModel):
     """Input schema for upserting an agenda item."""
 
+    model_config = _TOOL_ARGS_CONFIG
+
     item_type: str = Field(
         ...,
         description="Type of item: task, decision, obligation, question, or action_item",
@@ -55,6 +129,8 @@ class AgendaUpsertInput(BaseModel):
 class AgendaSearchInput(BaseModel):
     """Input schema for searching agenda items."""
 
+    model_config = _TOOL_ARGS_CONFIG
+
     query: str | None = Field(None, description="Text search in title/description")
     item_type: str | None = Field(
         None,
@@ -108,6 +184,7 @@ async def agenda_db_upsert_item(
             priority=priority,
         )
 
+        _invalidate_agenda_reads()
         action = "Updated" if item_id else "Created"
         logger.info(
             "agenda_tool_upsert",
@@ -120,12 +197,13 @@ async def agenda_db_upsert_item(
             f"{action} {item_type}: '{item.title}'\n"
             f"ID: {item.id}\n"
             f"Status: {item.status.value}\n"
-            f"Priority: {'urgent' if priority == 2 else 'high' if priority == 1 else 'normal'}"
+            f"Priority: {_PRIORITY_NAMES.get(priority, 'normal')}"
         )
 
     except Exception as e:
-        logger.error("agenda_tool_upsert_error", error=str(e))
-        return f"Error creating/updating agenda item: {e}"
+        err_msg = str(e)
+        logger.error("agenda_tool_upsert_error", error=err_msg)
+        return f"Error creating/updating agenda item: {err_msg}"
 
 
 @tool(args_schema=AgendaSearchInput)
@@ -149,8 +227,8 @@ async def agenda_db_search(
     """
     service = get_agenda_service()
 
-    try:
-        items = await service.search_items(
+    async def render() -> str:
+        items = await service.search_item_summaries(
             query=query,
             item_type=item_type,
             status=status,
@@ -170,34 +248,17 @@ async def agenda_db_search(
         if not items:
             return "No agenda items found matching the criteria."
 
-        results = []
-        for item in items:
-            status_emoji = {
-                "open": "📋",
-                "in_progress": "🔄",
-                "completed": "✅",
-                "deferred": "⏸️",
-                "cancelled": "❌",
-            }.get(item.status.value, "📋")
-
-            priority_str = ""
-            if item.priority == 2:
-                priority_str = " 🔴 URGENT"
-            elif item.priority == 1:
-                priority_str = " 🟡 HIGH"
-
-            assignee = f" → {item.assigned_to_user_name}" if item.assigned_to_user_name else ""
-
-            results.append(
-                f"{status_emoji} [{item.type.value.upper()}] {item.title}{priority_str}{assignee}\n"
-                f"   ID: {item.id} | Status: {item.status.value}"
-            )
-
-        return f"Found {len(items)} item(s):\n\n" + "\n\n".join(results)
+        return f"Found {len(items)} item(s):\n\n" + "\n\n".join(
+            _format_search_item(item) for item in items
+        )
 
+    try:
+        cache_key = (query, item_type, status, assigned_to, channel_id, limit)
+        return await _cached(_SEARCH_RESULTS, cache_key, render)
     except Exception as e:
-        logger.error("agenda_tool_search_error", error=str(e))
-        return f"Error searching agenda items: {e}"
+        err_msg = str(e)
+        logger.error("agenda_tool_search_error", error=err_msg)
+        return f"Error searching agenda items: {err_msg}"
 
 
 @tool
@@ -225,11 +286,38 @@ async def ingest_slack_message(
         }
         item = await ingestion.ingest_message(message, workspace_id)
         if item:
+            _invalidate_agenda_reads()
             return f"Ingested message as {item.type.value}: '{item.title}' (ID: {item.id})"
         return "Message ingested but no agenda item created (likely not relevant)."
     except Exception as e:
-        logger.error("ingest_message_error", error=str(e))
-        return f"Error ingesting message: {e}"
+        err_msg = str(e)
+        logger.error("ingest_message_error", error=err_msg)
+        return f"Error ingesting message: {err_msg}"
+
+
+@tool
+async def ingest_slack_messages(
+    messages: list[dict[str, Any]],
+    workspace_id: str | None = None,
+) -> str:
+    """Ingest several Slack messages at once and create agenda items.
+
+    Prefer this over repeated ingest_slack_message calls. Each message is a
+    dict with "text", "user", "channel", "ts" and optionally "thread_ts".
+    """
+    ingestion = get_ingestion_service()
+    try:
+        items = await ingestion.ingest_messages(messages, workspace_id)
+        if not items:
+            return "Messages ingested but no agenda items created (likely not relevant)."
+        _invalidate_agenda_reads()
+        return f"Ingested {len(messages)} message(s) as {len(items)} item(s):\n\n" + "\n".join(
+            f"• {item.type.value}: '{item.title}' (ID: {item.id})" for item in items
+        )
+    except Exception as e:
+        err_msg = str(e)
+        logger.error("ingest_messages_error", error=err_msg)
+        return f"Error ingesting messages: {err_msg}"
 
 
 @tool
@@ -240,21 +328,22 @@ async def get_my_tasks(
 ) -> str:
     """Get all tasks assigned to me, grouped by due date."""
     views = get_views_service()
-    try:
+
+    async def render() -> str:
         tasks = await views.get_my_tasks(user_id, workspace_id, include_completed)
         if not tasks:
             return "No tasks found."
+        return f"Your tasks ({len(tasks)}):\n\n" + "\n".join(
+            _format_my_task(task) for task in tasks
+        )
 
-        results = []
-        for task in tasks:
-            due_str = f" (Due: {task.due_date.strftime('%Y-%m-%d')})" if task.due_date else ""
-            priority_str = " 🔴" if task.priority == 2 else " 🟡" if task.priority == 1 else ""
-            results.append(f"• {task.title}{priority_str}{due_str}")
-
-        return f"Your tasks ({len(tasks)}):\n\n" + "\n".join(results)
+    try:
+        cache_key = (user_id, workspace_id, include_completed)
+        return await _cached(_MY_TASKS_RESULTS, cache_key, render)
     except Exception as e:
-        logger.error("get_my_tasks_error", error=str(e))
-        return f"Error getting tasks: {e}"
+        err_msg = str(e)
+        logger.error("get_my_tasks_error", error=err_msg)
+        return f"Error getting tasks: {err_msg}"
 
 
 @tool
@@ -268,11 +357,13 @@ async def update_task_status(
     try:
         item = await task_mgmt.update_task_status(task_id, status, changed_by)
         if item:
+            _invalidate_agenda_reads()
             return f"Updated task '{item.title}' to status: {status}"
         return f"Task {task_id} not found."
     except Exception as e:
-        logger.error("update_task_status_error", error=str(e))
-        return f"Error updating task status: {e}"
+        err_msg = str(e)
+        logger.error("update_task_status_error", error=err_msg)
+        return f"Error updating task status: {err_msg}"
 
 
 @tool
@@ -282,20 +373,22 @@ async def get_overdue_tasks(
 ) -> str:
     """Get all overdue tasks."""
     task_mgmt = get_task_management_service()
-    try:
+
+    async def render() -> str:
         tasks = await task_mgmt.get_overdue_tasks(user_id, workspace_id)
         if not tasks:
             return "No overdue tasks."
+        now = datetime.now(UTC).replace(tzinfo=None)
+        return f"Overdue tasks ({len(tasks)}):\n\n" + "\n".join(
+            _format_overdue_task(task, now) for task in tasks
+        )
 
-        results = []
-        for task in tasks:
-            days_overdue = (datetime.utcnow() - task.due_date).days if task.due_date else 0
-            results.append(f"• {task.title} ({days_overdue} days overdue)")
-
-        return f"Overdue tasks ({len(tasks)}):\n\n" + "\n".join(results)
+    try:
+        return await _cached(_OVERDUE_RESULTS, (user_id, workspace_id), render)
     except Exception as e:
-        logger.error("get_overdue_tasks_error", error=str(e))
-        return f"Error getting overdue tasks: {e}"
+        err_msg = str(e)
+        logger.error("get_overdue_tasks_error", error=err_msg)
+        return f"Error getting overdue tasks: {err_msg}"
 
 
 @tool
@@ -307,10 +400,11 @@ async def generate_morning_digest(
     digest = get_digest_service()
     try:
         digest_data = await digest.generate_morning_digest(user_id, workspace_id)
-        return await digest.format_digest_for_slack(digest_data, "morning_digest")
+        return digest.format_digest_for_slack(digest_data, "morning_digest")
     except Exception as e:
-        logger.error("generate_morning_digest_error", error=str(e))
-        return f"Error generating morning digest: {e}"
+        err_msg = str(e)
+        logger.error("generate_morning_digest_error", error=err_msg)
+        return f"Error generating morning digest: {err_msg}"
 
 
 @tool
@@ -328,15 +422,15 @@ async def extract_decisions_from_thread(
         )
         if not decisions:
             return "No decisions found in thread."
+        _invalidate_agenda_reads()
 
-        results = []
-        for decision in decisions:
-            results.append(f"• {decision.decision_text}")
-
-        return f"Extracted {len(decisions)} decision(s):\n\n" + "\n".join(results)
+        return f"Extracted {len(decisions)} decision(s):\n\n" + "\n".join(
+            f"• {decision.decision_text}" for decision in decisions
+        )
     except Exception as e:
-        logger.error("extract_decisions_error", error=str(e))
-        return f"Error extracting decisions: {e}"
+        err_msg = str(e)
+        logger.error("extract_decisions_error", error=err_msg)
+        return f"Error extracting decisions: {err_msg}"
 
 
 @tool
@@ -347,19 +441,22 @@ async def search_decisions_about(
 ) -> str:
     """Search for decisions about a specific topic."""
     search = get_search_service()
-    try:
+
+    async def render() -> str:
         decisions = await search.search_decisions_about(topic, workspace_id, limit)
         if not decisions:
             return f"No decisions found about '{topic}'."
+        return f"Decisions about '{topic}' ({len(decisions)}):\n\n" + "\n".join(
+            f"• {decision.title} ({decision.created_at.strftime('%Y-%m-%d')})"
+            for decision in decisions
+        )
 
-        results = []
-        for decision in decisions:
-            results.append(f"• {decision.title} ({decision.created_at.strftime('%Y-%m-%d')})")
-
-        return f"Decisions about '{topic}' ({len(decisions)}):\n\n" + "\n".join(results)
+    try:
+        return await _cached(_DECISION_RESULTS, (topic, workspace_id, limit), render)
     except Exception as e:
-        logger.error("search_decisions_error", error=str(e))
-        return f"Error searching decisions: {e}"
+        err_msg = str(e)
+        logger.error("search_decisions_error", error=err_msg)
+        return f"Error searching decisions: {err_msg}"
 
 
 @tool
@@ -375,8 +472,9 @@ async def find_similar_question(
             return f"Similar question found:\n\nQ: {faq.question}\nA: {faq.answer}"
         return "No similar questions found in FAQ."
     except Exception as e:
-        logger.error("find_similar_question_error", error=str(e))
-        return f"Error finding similar question: {e}"
+        err_msg = str(e)
+        logger.error("find_similar_question_error", error=err_msg)
+        return f"Error finding similar question: {err_msg}"
 
 
 @tool
@@ -390,11 +488,13 @@ async def snooze_task(
     try:
         item = await workflows.snooze_task(task_id, hours, changed_by)
         if item:
+            _invalidate_agenda_reads()
             return f"Snoozed task '{item.title}' for {hours} hours. New due date: {item.due_date}"
         return f"Task {task_id} not found."
     except Exception as e:
-        logger.error("snooze_task_error", error=str(e))
-        return f"Error snoozing task: {e}"
+        err_msg = str(e)
+        logger.error("snooze_task_error", error=err_msg)
+        return f"Error snoozing task: {err_msg}"
 
 
 @tool
@@ -411,26 +511,33 @@ async def reassign_task(
             task_id, new_assignee_user_id, new_assignee_user_name, changed_by
         )
         if item:
+            _invalidate_agenda_reads()
             return f"Reassigned task '{item.title}' to {new_assignee_user_name or new_assignee_user_id}"
         return f"Task {task_id} not found."
     except Exception as e:
-        logger.error("reassign_task_error", error=str(e))
-        return f"Error reassigning task: {e}"
+        err_msg = str(e)
+        logger.error("reassign_task_error", error=err_msg)
+        return f"Error reassigning task: {err_msg}"
+
+
+# Built once; get_agenda_tools hands out a copy so callers can extend it
+_AGENDA_TOOLS = (
+    agenda_db_upsert_item,
+    agenda_db_search,
+    ingest_slack_message,
+    ingest_slack_messages,
+    get_my_tasks,
+    update_task_status,
+    get_overdue_tasks,
+    generate_morning_digest,
+    extract_decisions_from_thread,
+    search_decisions_about,
+    find_similar_question,
+    snooze_task,
+    reassign_task,
+)
 
 
 def get_agenda_tools() -> list:
     """Get all agenda-related tools."""
-    return [
-        agenda_db_upsert_item,
-        agenda_db_search,
-        ingest_slack_message,
-        get_my_tasks,
-        update_task_status,
-        get_overdue_tasks,
-        generate_morning_digest,
-        extract_decisions_from_thread,
-        search_decisions_about,
-        find_similar_question,
-        snooze_task,
-        reassign_task,
-    ]
+    return list(_AGENDA_TOOLS)
@@ -1,12 +1,19 @@
 """Views service: Predefined and custom views for agenda items."""
 
-import json
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 from sqlalchemy import and_, or_, select
 
-from kiroween.agenda.models import AgendaItem, ItemStatus, ItemType, View
+from kiroween.agenda.models import (
+    AgendaItem,
+    ItemStatus,
+    ItemType,
+    View,
+    to_item_status,
+    to_item_type,
+)
 from kiroween.agenda.repository import AgendaRepository
 from kiroween.agenda.service import AgendaService
 from kiroween.utils.logging import get_logger
@@ -139,10 +146,10 @@ class ViewsService:
                 name=name,
                 description=description,
                 is_predefined=is_predefined,
-                filters=json.dumps(filters),
+                filters=filters,
             )
             repo.session.add(view)
-            await repo.session.commit()
+            await repo.session.flush()
             await repo.session.refresh(view)
 
             logger.info("created_view", view_id=view.id, name=name)
@@ -187,7 +194,7 @@ class ViewsService:
     ) -> View | None:
         """Update a view."""
         async with self.agenda_service.get_repository() as repo:
-            view = await self.get_view(view_id)
+            view = await repo.session.get(View, view_id)
             if not view:
                 return None
 
@@ -196,10 +203,9 @@ class ViewsService:
             if description is not None:
                 view.description = description
             if filters is not None:
-                view.filters = json.dumps(filters)
+                view.filters = filters
 
-            view.updated_at = datetime.utcnow()
-            await repo.session.commit()
+            await repo.session.flush()
             await repo.session.refresh(view)
 
             logger.info("updated_view", view_id=view_id)
@@ -208,12 +214,11 @@ class ViewsService:
     async def delete_view(self, view_id: str) -> bool:
         """Delete a view."""
         async with self.agenda_service.get_repository() as repo:
-            view = await self.get_view(view_id)
+            view = await repo.session.get(View, view_id)
             if not view:
                 return False
 
             await repo.session.delete(view)
-            await repo.session.commit()
 
             logger.info("deleted_view", view_id=view_id)
             return True
@@ -224,8 +229,7 @@ class ViewsService:
         if not view:
             return []
 
-        filters = json.loads(view.filters)
-        return await self._apply_filters(filters, limit)
+        return await self._apply_filters(view.filters, limit)
 
     async def _apply_filters(
         self,
@@ -254,18 +258,18 @@ class ViewsService:
             # Filter by type
             if item_type := filters.get("type"):
                 if isinstance(item_type, list):
-                    types = [ItemType(t) for t in item_type]
+                    types = [to_item_type(t) for t in item_type]
                     conditions.append(AgendaItem.type.in_(types))
                 else:
-                    conditions.append(AgendaItem.type == ItemType(item_type))
+                    conditions.append(AgendaItem.type == to_item_type(item_type))
 
             # Filter by status
             if status := filters.get("status"):
                 if isinstance(status, list):
-                    statuses = [ItemStatus(s) for s in status]
+                    statuses = [to_item_status(s) for s in status]
                     conditions.append(AgendaItem.status.in_(statuses))
                 else:
-                    conditions.append(AgendaItem.status == ItemStatus(status))
+                    conditions.append(AgendaItem.status == to_item_status(status))
 
             # Filter by channel
             if channel_id := filters.get("channel_id"):
@@ -292,7 +296,6 @@ class ViewsService:
                     or_(
                         AgendaItem.title.ilike(f"%{query}%"),
                         AgendaItem.description.ilike(f"%{query}%"),
-                        AgendaItem.raw_snippet.ilike(f"%{query}%"),
                     )
                 )
 
@@ -315,6 +318,7 @@ class ViewsService:
             return list(result.scalars().all())
 
 
+@lru_cache(maxsize=1)
 def get_views_service() -> ViewsService:
     """Get the global views service instance."""
     return ViewsService()
@@ -1,10 +1,11 @@
 """Personal workflows and user controls service."""
 
-import json
+from collections import defaultdict
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, or_, select
 
 from kiroween.agenda.models import AgendaItem, ItemStatus, ItemType, UserProfile
 from kiroween.agenda.repository import AgendaRepository
@@ -13,6 +14,9 @@ from kiroween.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Meeting-mode rows are streamed from a server-side cursor in batches of this size
+_MEETING_YIELD_PER = 200
+
 
 class PersonalWorkflowsService:
     """Service for personal workflows: focus modes, quick actions, etc."""
@@ -91,18 +95,17 @@ class PersonalWorkflowsService:
             stmt = select(AgendaItem).where(and_(*conditions))
             stmt = stmt.order_by(AgendaItem.priority.desc(), AgendaItem.due_date.asc().nulls_last())
 
-            result = await repo.session.execute(stmt)
-            items = list(result.scalars().all())
+            # Unbounded, so stream rows in batches and group as they arrive
+            items = await repo.session.stream_scalars(
+                stmt.execution_options(yield_per=_MEETING_YIELD_PER)
+            )
 
             # Group by type
-            by_type = {}
-            for item in items:
-                item_type = item.type.value
-                if item_type not in by_type:
-                    by_type[item_type] = []
-                by_type[item_type].append(item)
+            by_type = defaultdict(list)
+            async for item in items:
+                by_type[item.type.value].append(item)
 
-            return by_type
+            return dict(by_type)
 
     async def snooze_task(
         self,
@@ -120,11 +123,8 @@ class PersonalWorkflowsService:
             old_due_date = item.due_date
 
             item.due_date = new_due_date
-            item.due_at = new_due_date
-            item.updated_at = datetime.utcnow()
 
-            await repo.session.commit()
-            await repo.session.refresh(item)
+            await repo.session.flush()
 
             logger.info(
                 "snoozed_task",
@@ -151,10 +151,8 @@ class PersonalWorkflowsService:
             old_assignee = item.assigned_to_user_id
             item.assigned_to_user_id = new_assignee_user_id
             item.assigned_to_user_name = new_assignee_user_name
-            item.updated_at = datetime.utcnow()
 
-            await repo.session.commit()
-            await repo.session.refresh(item)
+            await repo.session.flush()
 
             logger.info(
                 "reassigned_task",
@@ -182,10 +180,8 @@ class PersonalWorkflowsService:
 
             old_priority = item.priority
             item.priority = priority
-            item.updated_at = datetime.utcnow()
 
-            await repo.session.commit()
-            await repo.session.refresh(item)
+            await repo.session.flush()
 
             logger.info(
                 "changed_priority",
@@ -209,17 +205,14 @@ class PersonalWorkflowsService:
                 return None
 
             # Add label
-            labels = item.labels.split(",") if item.labels else []
+            labels = item.labels or []
             ticket_label = f"ticket:{ticket_system}"
             if ticket_id:
                 ticket_label += f":{ticket_id}"
 
             if ticket_label not in labels:
-                labels.append(ticket_label)
-                item.labels = ",".join(labels)
-                item.updated_at = datetime.utcnow()
-                await repo.session.commit()
-                await repo.session.refresh(item)
+                item.labels = [*labels, ticket_label]
+                await repo.session.flush()
 
             logger.info(
                 "converted_to_ticket",
@@ -249,20 +242,20 @@ class PersonalWorkflowsService:
                     user_id=user_id,
                     workspace_id="",  # Will need to be set
                     focus_mode_enabled=True,
-                    focus_mode_settings=json.dumps({
+                    focus_mode_settings={
                         "top_n_tasks": top_n_tasks,
                         "suppress_low_priority": suppress_low_priority,
-                    }),
+                    },
                 )
                 repo.session.add(profile)
             else:
                 profile.focus_mode_enabled = True
-                profile.focus_mode_settings = json.dumps({
+                profile.focus_mode_settings = {
                     "top_n_tasks": top_n_tasks,
                     "suppress_low_priority": suppress_low_priority,
-                })
+                }
 
-            await repo.session.commit()
+            await repo.session.flush()
             await repo.session.refresh(profile)
 
             logger.info("enabled_focus_mode", user_id=user_id)
@@ -280,7 +273,7 @@ class PersonalWorkflowsService:
                 return None
 
             profile.focus_mode_enabled = False
-            await repo.session.commit()
+            await repo.session.flush()
             await repo.session.refresh(profile)
 
             logger.info("disabled_focus_mode", user_id=user_id)
@@ -295,6 +288,7 @@ class PersonalWorkflowsService:
             return result.scalar_one_or_none()
 
 
+@lru_cache(maxsize=1)
 def get_personal_workflows_service() -> PersonalWorkflowsService:
     """Get the global personal workflows service instance."""
     return PersonalWorkflowsService()
@@ -56,6 +56,21 @@ class Settings(BaseSettings):
     supabase_anon_key: str = Field(..., description="Supabase public anon key")
     supabase_service_role_key: str = Field(..., description="Supabase service role key")
     database_url: str = Field(..., description="PostgreSQL connection string")
+    database_pool_size: int = Field(
+        default=20, ge=1, description="Persistent connections kept in the pool"
+    )
+    database_max_overflow: int = Field(
+        default=40, ge=0, description="Extra connections allowed beyond the pool size"
+    )
+    database_pool_timeout: int = Field(
+        default=30, ge=1, description="Seconds to wait for a pooled connection"
+    )
+    database_pool_recycle: int = Field(
+        default=1800, description="Seconds before a pooled connection is replaced (-1 disables)"
+    )
+    database_query_cache_size: int = Field(
+        default=1200, ge=0, description="Compiled SQL statements cached per engine (0 disables)"
+    )
 
     # Application Settings
     app_env: Literal["development", "staging", "production"] = Field(default="development")
@@ -3,6 +3,7 @@
 import asyncio
 import sys
 
+from kiroween.agenda.repository import close_async_engine
 from kiroween.agenda.tools import get_agenda_tools
 from kiroween.agent.graph import build_graph, run_agent
 from kiroween.config import get_settings
@@ -91,6 +92,7 @@ async def run_interactive():
     finally:
         # Cleanup
         await mcp_manager.disconnect()
+        await close_async_engine()
 
 
 async def run_single(user_input: str) -> str:
@@ -119,6 +121,7 @@ async def run_single(user_input: str) -> str:
 
     finally:
         await mcp_manager.disconnect()
+        await close_async_engine()
 
 
 def main():
@@ -1,7 +1,11 @@
-"""Redis cache utilities for caching MCP tool results and Slack data."""
+"""Cache utilities: Redis for MCP tool results and Slack data, plus a small
+in-process TTL cache for hot local lookups."""
 
 import asyncio
 import json
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
 from typing import Any
 
 import redis.asyncio as redis
@@ -215,6 +219,42 @@ class RedisCache:
         return self._connected
 
 
+class TTLCache:
+    """In-process cache whose entries expire ``ttl`` seconds after being set.
+
+    For results that are cheap to key and read far more often than they
+    change, where even a Redis round trip costs more than the hit saves.
+    Beyond ``maxsize`` entries the least recently set one is evicted.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get a live value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value for ``ttl`` seconds."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+
 # Global cache instance
 _cache: RedisCache | None = None
 
@@ -1,9 +1,11 @@
 """Pytest fixtures for Kiroween tests."""
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from kiroween.agenda.models import Base
+from kiroween.agenda.service import AgendaService
 
 
 @pytest.fixture
@@ -20,6 +22,34 @@ async def db_session():
     await engine.dispose()
 
 
+@pytest.fixture
+def query_counter(db_session):
+    """Record every SQL statement issued through ``db_session``.
+
+    Assert on ``len(query_counter)`` to pin the number of round trips a
+    call makes, so per-row lazy loads show up as test failures.
+    """
+    statements: list[str] = []
+    engine = db_session.bind.sync_engine
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture
+def agenda_service(db_session):
+    """AgendaService whose units of work run against the test database."""
+    service = AgendaService.__new__(AgendaService)
+    service._session_factory = async_sessionmaker(
+        db_session.bind, class_=AsyncSession, expire_on_commit=False
+    )
+    return service
+
+
 @pytest.fixture
 def sample_agenda_item():
     """Sample agenda item data for testing."""
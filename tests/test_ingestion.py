@@ -0,0 +1,46 @@
+"""Tests for message ingestion."""
+
+from kiroween.agenda.ingestion import MessageIngestionService, extract_title
+
+
+def _ingestion_service(agenda_service):
+    service = MessageIngestionService.__new__(MessageIngestionService)
+    service.agenda_service = agenda_service
+    return service
+
+
+def _message(i):
+    return {
+        "text": f"Can you review the release notes for build {i}?",
+        "user": "U001",
+        "user_name": "alice",
+        "channel": "C123",
+        "ts": f"1700000000.{i:06d}",
+    }
+
+
+async def test_ingest_backfill_pages_and_dedupes(agenda_service, query_counter):
+    service = _ingestion_service(agenda_service)
+    messages = [_message(i) for i in range(250)]
+    # Overlapping history pages repeat messages already seen
+    messages += [_message(i) for i in range(200, 210)]
+
+    items = [
+        item
+        async for item in service.ingest_backfill(
+            iter(messages), workspace_id="W1", page_size=100
+        )
+    ]
+
+    assert [item.source_message_ts for item in items] == [
+        message["ts"] for message in messages[:250]
+    ]
+    inserts = [s for s in query_counter if s.lstrip().upper().startswith("INSERT")]
+    assert len(inserts) == 3
+
+
+def test_extract_title_scrubs_and_leaves_fallback_to_caller():
+    assert extract_title("Ship the *beta* <@U123> today. Then rest") == "Ship the beta  today"
+    assert extract_title("short plain title ") == "short plain title"
+    assert extract_title("<@U123> <https://example.com>") == ""
+    assert _ingestion_service(None).extract_title("<@U123>") == "Untitled"
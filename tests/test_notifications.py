@@ -0,0 +1,153 @@
+"""Tests for digests and notification policy."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from kiroween.agenda.models import AgendaItem, ItemStatus, ItemType, UserProfile
+from kiroween.agenda.notifications import DigestService, NotificationPolicyEngine
+
+NOW = datetime(2026, 10, 15, 9, 30)
+
+
+@pytest.fixture
+def digest_service(agenda_service):
+    service = DigestService.__new__(DigestService)
+    service.agenda_service = agenda_service
+    return service
+
+
+@pytest.fixture
+def policy_engine(agenda_service):
+    engine = NotificationPolicyEngine.__new__(NotificationPolicyEngine)
+    engine.agenda_service = agenda_service
+    return engine
+
+
+async def _add_items(agenda_service, *items):
+    async with agenda_service.get_repository() as repo:
+        repo.session.add_all(items)
+
+
+def _task(title, **fields):
+    fields.setdefault("assigned_to_user_id", "U1")
+    fields.setdefault("status", ItemStatus.OPEN)
+    return AgendaItem(type=ItemType.TASK, title=title, **fields)
+
+
+async def test_morning_digest_due_today_is_half_open(agenda_service, digest_service):
+    await _add_items(
+        agenda_service,
+        _task("start of day", due_date=NOW.replace(hour=0, minute=0)),
+        _task("end of day", due_date=NOW.replace(hour=23, minute=59)),
+        _task("yesterday", due_date=NOW - timedelta(days=1)),
+        _task("tomorrow midnight", due_date=NOW.replace(hour=0, minute=0) + timedelta(days=1)),
+        _task("done", due_date=NOW, status=ItemStatus.COMPLETED),
+        _task("someone else", due_date=NOW, assigned_to_user_id="U2"),
+    )
+
+    digest = await digest_service.generate_morning_digest("U1", now=NOW)
+
+    assert sorted(item.title for item in digest["tasks_due_today"]) == [
+        "end of day",
+        "start of day",
+    ]
+
+
+@pytest.fixture
+async def busy_user(agenda_service):
+    """A user with enough tasks and decisions that a per-row query would show."""
+    items = []
+    for i in range(20):
+        items.append(_task(f"due {i}", due_date=NOW + timedelta(minutes=i)))
+        items.append(_task(f"overdue {i}", due_date=NOW - timedelta(days=2)))
+        items.append(_task(f"closed {i}", status=ItemStatus.COMPLETED, completed_at=NOW))
+        items.append(
+            AgendaItem(
+                type=ItemType.DECISION,
+                title=f"decision {i}",
+                status=ItemStatus.OPEN,
+                requestor_user_id="U1",
+                priority=1,
+            )
+        )
+    await _add_items(agenda_service, *items)
+    return "U1"
+
+
+async def test_morning_digest_query_count(digest_service, busy_user, query_counter):
+    query_counter.clear()
+    digest = await digest_service.generate_morning_digest(busy_user, now=NOW)
+
+    assert len(digest["tasks_due_today"]) == 20
+    assert len(query_counter) <= 2
+    # Formatting reads loaded columns only; a lazy load would raise here
+    assert digest_service.format_digest_for_slack(digest, "morning_digest")
+    assert len(query_counter) <= 2
+
+
+async def test_end_of_day_recap_query_count(digest_service, busy_user, query_counter):
+    query_counter.clear()
+    recap = await digest_service.generate_end_of_day_recap(busy_user, now=NOW)
+
+    assert len(recap["overdue"]) == 20
+    assert len(query_counter) <= 2
+    assert digest_service.format_digest_for_slack(recap, "end_of_day")
+    assert len(query_counter) <= 2
+
+
+async def test_while_you_were_away_query_count(digest_service, busy_user, query_counter):
+    query_counter.clear()
+    summary = await digest_service.generate_while_you_were_away(
+        busy_user, NOW - timedelta(days=1), datetime(2100, 1, 1)
+    )
+
+    assert summary["total_count"] == 80
+    assert len(query_counter) <= 2
+
+
+async def test_decide_notification_actions_loads_preferences_once(
+    agenda_service, policy_engine, query_counter
+):
+    silent = {"instant_for": [], "batch_everything_else": False}
+    await _add_items(
+        agenda_service,
+        *(
+            UserProfile(workspace_id="W1", user_id=f"U{i}", notification_preferences=silent)
+            for i in range(10)
+        ),
+    )
+    burst = [(_task(f"task {i}", priority=0), f"U{i % 12}") for i in range(40)]
+
+    query_counter.clear()
+    actions = await policy_engine.decide_notification_actions(burst)
+
+    assert len(query_counter) == 1
+    # U10 and U11 have no profile, so the default preferences batch their items
+    assert actions == [
+        "batch" if user_id in ("U10", "U11") else "silent" for _, user_id in burst
+    ]
+
+
+async def test_decide_notification_actions_share_now(agenda_service, policy_engine):
+    instant = {"instant_for": ["high_priority"], "quiet_hours": {"start": "22:00", "end": "08:00"}}
+    await _add_items(
+        agenda_service,
+        UserProfile(workspace_id="W1", user_id="U1", notification_preferences=instant),
+    )
+    burst = [(_task("urgent", priority=2), "U1")] * 3
+
+    assert await policy_engine.decide_notification_actions(
+        burst, NOW.replace(hour=23)
+    ) == ["batch"] * 3
+    assert await policy_engine.decide_notification_actions(burst, NOW) == ["instant"] * 3
+
+
+def test_is_quiet_hours_leaves_preferences_untouched(policy_engine):
+    preferences = {"quiet_hours": {"start": "22:00", "end": "08:00"}}
+
+    assert policy_engine.is_quiet_hours(preferences, NOW.replace(hour=23))
+    assert preferences == {"quiet_hours": {"start": "22:00", "end": "08:00"}}
+
+    preferences["quiet_hours"] = {"start": "09:00", "end": "10:00"}
+    assert policy_engine.is_quiet_hours(preferences, NOW)
@@ -0,0 +1,22 @@
+"""Tests for the agenda repository."""
+
+from kiroween.agenda.models import AgendaItem, ItemStatus, ItemType
+from kiroween.agenda.repository import AgendaRepository
+
+
+async def test_search_by_tag(db_session):
+    repo = AgendaRepository(db_session)
+    db_session.add_all(
+        [
+            AgendaItem(type=ItemType.TASK, status=ItemStatus.OPEN, title="a", tags=["infra", "q4"]),
+            AgendaItem(type=ItemType.TASK, status=ItemStatus.OPEN, title="b", tags=["q4"]),
+            AgendaItem(type=ItemType.TASK, status=ItemStatus.OPEN, title="c"),
+        ]
+    )
+    await db_session.flush()
+
+    # The second lookup reuses the cached statement with a new tag value
+    assert [item.title for item in await repo.search(tag="infra")] == ["a"]
+    assert sorted(item.title for item in await repo.search(tag="q4")) == ["a", "b"]
+    assert [row.title for row in await repo.search_summaries(tag="infra")] == ["a"]
+    assert await repo.search(tag="missing") == []
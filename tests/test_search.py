@@ -0,0 +1,20 @@
+"""Tests for search and knowledge services."""
+
+from kiroween.agenda.models import FAQAnswer
+from kiroween.agenda.search import KnowledgeService
+
+
+async def test_search_faq_by_tag(agenda_service):
+    knowledge = KnowledgeService(agenda_service)
+    async with agenda_service.get_repository() as repo:
+        repo.session.add_all(
+            [
+                FAQAnswer(workspace_id="W1", question="How to deploy?", answer="a", tags=["ops"]),
+                FAQAnswer(workspace_id="W1", question="Deploy rollback?", answer="b"),
+                FAQAnswer(workspace_id="W1", question="Who is on call?", answer="c", tags=["ops"]),
+            ]
+        )
+
+    assert [faq.answer for faq in await knowledge.search_faq("deploy", tag="ops")] == ["a"]
+    assert len(await knowledge.search_faq("deploy")) == 2
+    assert await knowledge.search_faq("deploy", tag="missing") == []
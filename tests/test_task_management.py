@@ -0,0 +1,40 @@
+"""Tests for task lifecycle management."""
+
+import pytest
+
+from kiroween.agenda.models import AgendaItem, ItemStatus, ItemType
+from kiroween.agenda.task_management import TaskManagementService
+
+
+@pytest.fixture
+def task_service(agenda_service):
+    service = TaskManagementService.__new__(TaskManagementService)
+    service.agenda_service = agenda_service
+    return service
+
+
+async def test_close_tasks_in_thread_updates_shared_repo(agenda_service, task_service):
+    async with agenda_service.get_repository() as repo:
+        open_task = AgendaItem(
+            type=ItemType.TASK,
+            status=ItemStatus.OPEN,
+            title="open",
+            source_thread_ts="1700000000.000001",
+        )
+        other_thread = AgendaItem(
+            type=ItemType.TASK,
+            status=ItemStatus.OPEN,
+            title="other thread",
+            source_thread_ts="1700000000.000002",
+        )
+        repo.session.add_all([open_task, other_thread])
+        await repo.session.flush()
+
+        count = await task_service.close_tasks_in_thread("1700000000.000001", repo=repo)
+
+        # Objects already in the caller's session reflect the UPDATE
+        assert count == 1
+        assert open_task.status == ItemStatus.COMPLETED
+        await repo.session.refresh(open_task, ["completed_at"])
+        assert open_task.completed_at is not None
+        assert other_thread.status == ItemStatus.OPEN
@@ -0,0 +1,46 @@
+"""Tests for thread and decision management."""
+
+import pytest
+
+from kiroween.agenda.thread_management import ThreadManagementService
+
+
+@pytest.fixture
+def thread_service(agenda_service):
+    return ThreadManagementService(agenda_service)
+
+
+async def test_extract_decisions_one_per_trigger(thread_service):
+    decisions = await thread_service.extract_decisions_from_thread(
+        [
+            {
+                "text": "Decision: use Postgres. Later, DECISION: use Redis. "
+                "We decided to ship Friday.",
+                "ts": "1700000000.000001",
+            },
+            {"text": "decision: keep the cron job", "ts": "1700000000.000002"},
+        ],
+        workspace_id="W1",
+        channel_id="C1",
+        thread_ts="1700000000.000001",
+    )
+
+    assert [d.decision_text for d in decisions] == [
+        "use Postgres",
+        "to ship Friday",
+        "keep the cron job",
+    ]
+    assert all(d.agenda_item_id for d in decisions)
+
+
+async def test_infer_thread_title_upserts(thread_service):
+    first = await thread_service.infer_thread_title(
+        [{"text": "Launch plan for Q4. Details below"}], "C1", "1700000000.000001", "W1"
+    )
+    assert (first.title, first.message_count) == ("Launch plan for Q4", 1)
+
+    again = await thread_service.infer_thread_title(
+        [{"text": "Revised launch plan"}, {"text": "ok"}], "C1", "1700000000.000001", "W1"
+    )
+    assert again.id == first.id
+    assert (again.title, again.message_count) == ("Revised launch plan", 2)
@@ -0,0 +1,45 @@
+"""Tests for the agenda LangChain tools."""
+
+import pytest
+from sqlalchemy import select
+
+from kiroween.agenda import tools
+from kiroween.agenda.models import FAQAnswer
+from kiroween.agenda.search import KnowledgeService
+from kiroween.utils.cache import TTLCache
+
+
+async def test_cached_renders_once_and_never_caches_errors():
+    cache = TTLCache(ttl=60)
+    calls = []
+
+    async def render():
+        calls.append(1)
+        return "rendered"
+
+    async def fail():
+        raise RuntimeError("db down")
+
+    assert await tools._cached(cache, "key", render) == "rendered"
+    assert await tools._cached(cache, "key", render) == "rendered"
+    assert len(calls) == 1
+
+    with pytest.raises(RuntimeError):
+        await tools._cached(cache, "other", fail)
+    assert cache.get("other") is None
+
+
+async def test_find_similar_question_records_every_use(agenda_service, monkeypatch):
+    knowledge = KnowledgeService(agenda_service)
+    monkeypatch.setattr(tools, "get_knowledge_service", lambda: knowledge)
+    await knowledge.create_faq_answer("W1", "how do I deploy the api", "Run make deploy")
+
+    for _ in range(2):
+        reply = await tools.find_similar_question.ainvoke(
+            {"question": "How do I deploy the API", "workspace_id": "W1"}
+        )
+        assert "Run make deploy" in reply
+
+    async with agenda_service.get_repository() as repo:
+        faq = (await repo.session.scalars(select(FAQAnswer))).one()
+    assert faq.usage_count == 2